@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A benchmark of the simplified poker game. It measures the throughput and the
+latency of who_wins, of the is_* predicates, of the get_winner_in_* 
+tie-breakers and of the start of the command line program, on generated 
+workloads, and compares the results with a saved baseline.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import lib_poker as util 
+import poker
+
+
+DECK = [card for card in util.CARD_SET for _ in range(4)]
+
+PREDICATES = ['is_high_card', 'is_pair', 'is_two_pairs', 'is_triples', 
+              'is_full_house', 'is_four_of_a_kind']
+
+# the tie-breaker of each combination type, as used by the original 
+# poker.get_winer_same_combination
+TIE_BREAKERS = {1: 'get_winner_in_high_card',
+                2: 'get_winner_in_pairs',
+                3: 'get_winner_in_two_pairs',
+                4: 'get_winner_in_triples',
+                5: 'get_winner_in_full_house',
+                6: 'get_winner_in_four_a_kind'
+               }
+
+WORKLOADS = ['uniform', 'skewed', 'ties']
+
+# a result slower than the baseline by more than this fraction is flagged
+THRESHOLD = 0.10
+
+# the per-call latency is measured on at most this many calls
+LATENCY_SAMPLES = 2000
+
+
+def _shuffle_hand(rng, hand):
+    cards = list(hand)
+    rng.shuffle(cards)
+    return(''.join(cards))
+
+
+def _hands_by_type():
+    hands_by_type = {}
+    for hand, combination_type in zip(util.HANDS_BY_STRENGTH, 
+                                      util.COMBINATION_TYPE_BY_STRENGTH):
+        hands_by_type.setdefault(combination_type, []).append(hand)
+    return(hands_by_type)
+
+
+def generate_pairs(workload, count, rng, combination_type=None):
+    ''' Generate pairs of hands.
+    input: the workload, the number of pairs, the random generator and 
+    optionally the combination type of both hands
+    workloads: 
+        uniform: the hands are dealt from a deck 
+        skewed: the combination type of each hand is picked uniformly, so 
+            the rare combination types are much more frequent than in a deal
+        ties: the second hand holds the cards of the first hand in another
+            order
+    With a combination type, the hands are picked among the hands of that 
+    type instead of being dealt. 
+    return: a list of (hand_1, hand_2)
+    '''
+
+    hands_by_type = _hands_by_type()
+    pairs = []
+    while len(pairs) < count:
+        if combination_type is not None:
+            hands = hands_by_type[combination_type]
+            hand_1 = _shuffle_hand(rng, rng.choice(hands))
+            hand_2 = _shuffle_hand(rng, rng.choice(hands))
+        elif workload == 'uniform':
+            cards = rng.sample(DECK, 10)
+            hand_1, hand_2 = ''.join(cards[:5]), ''.join(cards[5:])
+        else:
+            hand_1 = _shuffle_hand(rng, rng.choice(
+                    hands_by_type[rng.randint(1, 6)]))
+            hand_2 = _shuffle_hand(rng, rng.choice(
+                    hands_by_type[rng.randint(1, 6)]))
+
+        if workload == 'ties':
+            hand_2 = _shuffle_hand(rng, hand_1)
+        pairs.append((hand_1, hand_2))
+
+    return(pairs)
+
+
+def measure(function, inputs, repeat=3):
+    ''' Measure a function over a list of inputs.
+    input: the function, a list of argument tuples and the number of timed 
+    runs over the inputs
+    return: a dictionary of the best throughput in calls per second and the 
+    median and 99th percentile latency of one call in nanoseconds
+    '''
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in inputs:
+            function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    clock = time.perf_counter_ns
+    latencies = []
+    for args in inputs[:LATENCY_SAMPLES]:
+        start = clock()
+        function(*args)
+        latencies.append(clock() - start)
+    latencies.sort()
+
+    return({'ops_per_sec': len(inputs) / best if best else float('inf'),
+            'p50_ns': latencies[len(latencies) // 2],
+            'p99_ns': latencies[int(len(latencies) * 0.99)]})
+
+
+def measure_cli(runs):
+    ''' Measure the start of the command line program for one pair of hands.
+    return: a dictionary of the runs per second and the median and 99th 
+    percentile latency of one run in nanoseconds
+    '''
+
+    command = [sys.executable, os.path.join(os.path.dirname(
+            os.path.abspath(__file__)), 'poker.py'), 'AAAQQ', 'QQQAA']
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        latencies.append(time.perf_counter_ns() - start)
+    latencies.sort()
+
+    return({'ops_per_sec': runs * 1e9 / sum(latencies),
+            'p50_ns': latencies[len(latencies) // 2],
+            'p99_ns': latencies[int(len(latencies) * 0.99)]})
+
+
+def run_benchmarks(count=10000, seed=0, cli_runs=10, name_filter=''):
+    ''' Run all benchmarks.
+    input: the number of calls per benchmark, the seed of the workloads, the
+    number of runs of the command line program (0 to skip it) and a 
+    substring that the names of the benchmarks to run must contain
+    return: a dictionary of the environment ('meta') and of the 
+    measurements of each benchmark ('results')
+    '''
+
+    results = {}
+
+    def run(name, function, inputs):
+        if name_filter in name:
+            results[name] = measure(function, inputs)
+
+    for workload in WORKLOADS:
+        rng = random.Random('{}:{}'.format(seed, workload))
+        pairs = generate_pairs(workload, count, rng)
+
+        run('who_wins/' + workload, poker.who_wins, pairs)
+
+        hands = [(hand_1,) for hand_1, hand_2 in pairs]
+        for predicate in PREDICATES:
+            run('{}/{}'.format(predicate, workload), 
+                getattr(util, predicate), hands)
+
+        for combination_type, tie_breaker in TIE_BREAKERS.items():
+            name = '{}/{}'.format(tie_breaker, workload)
+            if name_filter not in name:
+                continue
+            typed_pairs = [(util.order_cards_by_value(hand_1), 
+                            util.order_cards_by_value(hand_2)) 
+                           for hand_1, hand_2 in generate_pairs(
+                                   workload, count, rng, combination_type)]
+            run(name, getattr(util, tie_breaker), typed_pairs)
+
+    if cli_runs and name_filter in 'cli/startup':
+        results['cli/startup'] = measure_cli(cli_runs)
+
+    return({'meta': {'python': platform.python_version(),
+                     'implementation': platform.python_implementation(),
+                     'machine': platform.machine(),
+                     'count': count,
+                     'seed': seed},
+            'results': results})
+
+
+def compare_results(results, baseline, threshold=THRESHOLD):
+    ''' Compare benchmark results with a baseline.
+    input: the results and the baseline, as returned by run_benchmarks, and
+    the largest allowed loss of throughput as a fraction
+    return: a list of (name, baseline ops/s, ops/s, change) of every 
+    benchmark whose throughput dropped by more than the threshold
+    '''
+
+    regressions = []
+    for name, measurement in sorted(results['results'].items()):
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['ops_per_sec']
+        after = measurement['ops_per_sec']
+        change = (after - before) / before
+        if change < -threshold:
+            regressions.append((name, before, after, change))
+
+    return(regressions)
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    parser = argparse.ArgumentParser(description='Benchmark the poker game.')
+    parser.add_argument('-n', '--count', type=int, default=10000, 
+                        help='the number of calls per benchmark')
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('--cli-runs', type=int, default=10, 
+                        help='the number of runs of poker.py (0 to skip)')
+    parser.add_argument('-k', '--filter', default='', 
+                        help='only run the benchmarks whose name contains '
+                        'this string')
+    parser.add_argument('-o', '--output', 
+                        help='save the results to this JSON file')
+    parser.add_argument('-b', '--baseline', 
+                        help='compare the results with this JSON file')
+    parser.add_argument('-t', '--threshold', type=float, default=THRESHOLD,
+                        help='the loss of throughput that is flagged as a '
+                        'regression (default: %(default)s)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.count, args.seed, args.cli_runs, 
+                             args.filter)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+    for name, measurement in sorted(results['results'].items()):
+        print('{:<40} {:>14,.0f} ops/s  p50 {:>10,} ns  p99 {:>10,} ns'.format(
+            name, measurement['ops_per_sec'], measurement['p50_ns'], 
+            measurement['p99_ns']))
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_results(results, json.load(baseline_file), 
+                                          args.threshold)
+        for name, before, after, change in regressions:
+            print('REGRESSION {}: {:,.0f} -> {:,.0f} ops/s ({:+.1%})'.format(
+                name, before, after, change))
+        if regressions:
+            sys.exit(1)
@@ -27,14 +27,20 @@
 # THE SOFTWARE.
 
 
+import array
 import collections 
+import itertools
+import os
 import sys
+import zlib
 
 
-CARD_SET = list('23456789TJQKA')
-
-CARD_VALUE = {'2':2, '3':3, '4':4, '5':5, '6':6, '7':7, '8':8, '9':9, 'T':10, 
-        'J':11, 'Q':12, 'K':13, 'A':14}
+# the rules that do not need the tables are shared with the processes that
+# only read tables built elsewhere
+from poker_rules import (CARD_SET, CARD_VALUE, COMBINATION_TYPE_BY_PATTERN, 
+                         TABLES_VERSION, POSSIBLE_HANDS, OUTCOME_ROW_SIZE, 
+                         get_tables_fingerprint, compare_strengths, 
+                         get_rules_key)
 
 WINNER_MSG = {0: 'It\'s a tie!',
               1: 'First hand wins!',
@@ -42,6 +48,10 @@ WINNER_MSG = {0: 'It\'s a tie!',
               -1: 'Game Error'
              }
 
+# the opt-in cache of check_card_combination_type and 
+# poker.get_winer_same_combination, see enable_cache
+hand_cache = None
+
 def character_frequency(the_string):
     ''' Count the frequency of characters in a string. '''
     
@@ -172,6 +182,23 @@ def check_card_combination_type(hand):
         6: four of a kind 
         -1: not a possible card combination 
      '''
+
+    if type(hand) is Hand:
+        return(hand.combination_type)
+
+    if hand_cache is None:
+        return(_check_card_combination_type(hand))
+
+    key = ('type', get_canonical_hand(hand))
+    combination_type = hand_cache.get(key)
+    if combination_type is None:
+        combination_type = _check_card_combination_type(key[1])
+        hand_cache.put(key, combination_type)
+
+    return(combination_type)
+
+def _check_card_combination_type(hand):
+    ''' Check the cards combination type within a hand, without the cache.'''
     
     if is_four_of_a_kind(hand):
         #print('{} is four of a kind'.format(hand))
@@ -200,15 +227,7 @@ def get_valuable_card(cards):
      return: a card
      '''
     
-    all_cards = [c for c in cards]
-    valuable_card = ''
-    for card in set(all_cards):
-        if not valuable_card: 
-            valuable_card = card
-        elif CARD_VALUE[card] >= CARD_VALUE[valuable_card]:
-            valuable_card = card
-
-    return(valuable_card)
+    return(max(cards, key=CARD_VALUE.get, default=''))
 
 def order_cards_by_value(cards):
     ''' Order a set of cards by value in descending order. 
@@ -216,15 +235,7 @@ def order_cards_by_value(cards):
     return: list of ordered cards (high to low)
     '''
  
-    all_cards = [c for c in cards]
-    ordered_cards = []
-
-    while all_cards:
-        valuable_card = get_valuable_card(all_cards)
-        ordered_cards.append(valuable_card)
-        all_cards.remove(valuable_card)
-
-    return(ordered_cards)
+    return(sorted(cards, key=CARD_VALUE.get, reverse=True))
 
 def get_winner_in_high_card(all_cards_1, all_cards_2):
     ''' Find the winner from high card combination.
@@ -269,8 +280,8 @@ def get_winner_in_pairs(all_cards_1, all_cards_2):
         return(2)
     else:
         # remove the pairs and consider the remaining cards as a high card combination 
-        cards_1_pair_remv = remove_all_from_list(all_cards_1, [hand_1_pair])
-        cards_2_pair_remv = remove_all_from_list(all_cards_2, [hand_2_pair])
+        cards_1_pair_remv = remove_all_from_list(list(all_cards_1), [hand_1_pair])
+        cards_2_pair_remv = remove_all_from_list(list(all_cards_2), [hand_2_pair])
 
         winner = get_winner_in_high_card(cards_1_pair_remv, cards_2_pair_remv)
     
@@ -289,24 +300,22 @@ def get_winner_in_two_pairs(all_cards_1, all_cards_2):
     hand_1_pairs = get_repeated_card(all_cards_1, 2)
     hand_2_pairs = get_repeated_card(all_cards_2, 2)
     
-    # order the pairs cards in ascending order
+    # order the pairs cards in descending order
     hand_1_pairs_ordered = order_cards_by_value(hand_1_pairs)
     hand_2_pairs_ordered = order_cards_by_value(hand_2_pairs)
     
-    # Compare the two pairs at each hand 
-    for card in hand_1_pairs_ordered:
-        if card in hand_2_pairs_ordered:
-            continue
-        elif CARD_VALUE[card] > CARD_VALUE[hand_2_pairs_ordered[0]]:
+    # Compare the higher pairs of the hands first, then the lower pairs
+    for card_1, card_2 in zip(hand_1_pairs_ordered, hand_2_pairs_ordered):
+        if CARD_VALUE[card_1] > CARD_VALUE[card_2]:
             return(1)
-        elif CARD_VALUE[card] < CARD_VALUE[hand_2_pairs_ordered[0]]:
+        elif CARD_VALUE[card_1] < CARD_VALUE[card_2]:
             return(2)
 
 
     # remove the two pairs and consider the remaining card at each hand 
     # as a high card combination 
-    cards_1_pairs_remv = remove_all_from_list(all_cards_1, hand_1_pairs)
-    cards_2_pairs_remv = remove_all_from_list(all_cards_2, hand_2_pairs)
+    cards_1_pairs_remv = remove_all_from_list(list(all_cards_1), hand_1_pairs)
+    cards_2_pairs_remv = remove_all_from_list(list(all_cards_2), hand_2_pairs)
     
     # TO DO: can be doable with simple card value comparison. 
     winner = get_winner_in_high_card(cards_1_pairs_remv, cards_2_pairs_remv)
@@ -333,8 +342,10 @@ def get_winner_in_triples(all_cards_1, all_cards_2):
     else:
         # remove the triples and consider the remaining card as a high card 
         # combination 
-        cards_1_triples_remv = remove_all_from_list(all_cards_1, hand_1_triples)
-        cards_2_triples_remv = remove_all_from_list(all_cards_2, hand_2_triples)
+        cards_1_triples_remv = remove_all_from_list(list(all_cards_1), 
+                                                    hand_1_triples)
+        cards_2_triples_remv = remove_all_from_list(list(all_cards_2), 
+                                                    hand_2_triples)
         
         winner = get_winner_in_high_card(cards_1_triples_remv, cards_2_triples_remv)
         return(winner)
@@ -389,15 +400,564 @@ def get_winner_in_four_a_kind(all_cards_1, all_cards_2):
         return(2)
 
     # second compare the single card at each hand 
-    cards_1_fours_remv = remove_all_from_list(all_cards_1, hand_1_fours)
-    cards_2_fours_remv = remove_all_from_list(all_cards_2, hand_2_fours)
+    cards_1_fours_remv = remove_all_from_list(list(all_cards_1), hand_1_fours)
+    cards_2_fours_remv = remove_all_from_list(list(all_cards_2), hand_2_fours)
     
-    if CARD_VALUE[hand_1_fours_remv[0]] > CARD_VALUE[hand_2_fours_remv[0]]:
+    if CARD_VALUE[cards_1_fours_remv[0]] > CARD_VALUE[cards_2_fours_remv[0]]:
         return(1)
-    elif CARD_VALUE[hand_1_fours_remv[0]] < CARD_VALUE[hand_2_fours_remv[0]]:
+    elif CARD_VALUE[cards_1_fours_remv[0]] < CARD_VALUE[cards_2_fours_remv[0]]:
         return(2)
     else:
         return(0)
     
     return(-1)
 
+
+class Hand(object):
+    ''' An immutable hand that is parsed once. 
+
+    It holds the number of cards of each value, in the order of CARD_SET, 
+    and the strength, combination type and key of the hand, so the functions
+    of this module that get a Hand do not count its cards again. It iterates
+    over its cards from the most valuable to the least valuable, like the 
+    lists of order_cards_by_value. Hands compare by strength, so two hands 
+    with the same cards are equal.
+    '''
+
+    __slots__ = ('cards', 'counts', 'strength', 'combination_type', 'key')
+
+    def __init__(self, cards):
+        if type(cards) is Hand:
+            strength = cards.strength
+        else:
+            strength = STRENGTH_TABLE.get(''.join(sorted(cards)), -1)
+            if strength < 0:
+                raise ValueError('{!r} is not a possible hand'.format(cards))
+
+        set_slot = object.__setattr__
+        set_slot(self, 'cards', ''.join(sorted(HANDS_BY_STRENGTH[strength], 
+                                               key=CARD_VALUE.get, 
+                                               reverse=True)))
+        set_slot(self, 'counts', tuple(self.cards.count(card) 
+                                       for card in CARD_SET))
+        set_slot(self, 'strength', strength)
+        set_slot(self, 'combination_type', 
+                 COMBINATION_TYPE_BY_STRENGTH[strength])
+        set_slot(self, 'key', hand_key(self.cards))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Hand is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Hand is immutable')
+
+    def __repr__(self):
+        return('Hand({!r})'.format(self.cards))
+
+    def __str__(self):
+        return(self.cards)
+
+    def __iter__(self):
+        return(iter(self.cards))
+
+    def __len__(self):
+        return(len(self.cards))
+
+    def __contains__(self, card):
+        return(card in self.cards)
+
+    def count(self, card):
+        ''' Count the cards of a value in the hand. '''
+
+        return(self.cards.count(card))
+
+    def __hash__(self):
+        return(hash(self.strength))
+
+    def __eq__(self, other):
+        if type(other) is not Hand:
+            return(NotImplemented)
+        return(self.strength == other.strength)
+
+    def __lt__(self, other):
+        if type(other) is not Hand:
+            return(NotImplemented)
+        return(self.strength < other.strength)
+
+    def __le__(self, other):
+        if type(other) is not Hand:
+            return(NotImplemented)
+        return(self.strength <= other.strength)
+
+    def __gt__(self, other):
+        if type(other) is not Hand:
+            return(NotImplemented)
+        return(self.strength > other.strength)
+
+    def __ge__(self, other):
+        if type(other) is not Hand:
+            return(NotImplemented)
+        return(self.strength >= other.strength)
+
+
+def get_canonical_hand(hand):
+    ''' Get the canonical form of a hand, that is, its cards sorted. Hands
+    that hold the same cards in a different order share one canonical form.
+    input: a hand
+    return: a string of the sorted cards
+    '''
+
+    return(''.join(sorted(hand)))
+
+
+def hand_key(hand):
+    ''' Build a comparable key of a hand: the combination type first, then 
+    the values of the repeated cards and then the values of the kickers, high 
+    to low. A stronger hand has a larger key, so hands can be compared with 
+    `<` or ordered with sorted(hands, key=hand_key). 
+    input: a hand
+    return: a tuple of the combination type and the card values, or (-1,) if
+    it is not a possible card combination
+    '''
+
+    if type(hand) is Hand:
+        return(hand.key)
+
+    return(get_rules_key(hand))
+
+
+def build_strength_table():
+    ''' Build a table of the strength of every possible hand. Without suits
+    there are only 6175 distinct hands (the cards of a hand are a multiset of 
+    the 13 card values, each at most 4 times), so all of them are ranked once.
+    return: a dictionary that maps a canonical hand to its strength, where 
+    the weakest hand has strength 0 and a stronger hand has a larger strength.
+    '''
+
+    hands = [''.join(cards) for cards in 
+             itertools.combinations_with_replacement(CARD_SET, 5)
+             if len(set(cards)) > 1]
+    hands.sort(key=hand_key)
+
+    return({get_canonical_hand(hand): strength 
+            for strength, hand in enumerate(hands)})
+
+
+def get_tables_path():
+    ''' Get the path of the file of the saved tables. It is in the directory
+    given by the POKER_CACHE_DIR environment variable, or in ~/.cache/poker.
+    return: the path, or None if POKER_CACHE_DIR is set but empty
+    '''
+
+    directory = os.environ.get('POKER_CACHE_DIR')
+    if directory is None:
+        directory = os.path.join(os.path.expanduser('~'), '.cache', 'poker')
+    elif not directory:
+        return(None)
+
+    return(os.path.join(directory, 'tables-v{}.bin'.format(TABLES_VERSION)))
+
+
+def build_tables():
+    ''' Build the evaluation tables.
+    return: a tuple of the hands by strength, from the weakest hand to the 
+    strongest, and of their combination types
+    '''
+
+    strength_table = build_strength_table()
+    hands_by_strength = sorted(strength_table, key=strength_table.get)
+
+    return(hands_by_strength, 
+           [hand_key(hand)[0] for hand in hands_by_strength])
+
+
+def save_tables(path, hands_by_strength, combination_types):
+    ''' Save the evaluation tables to a file. The file holds a header line 
+    with the format version, the fingerprint of the rules, the number of 
+    hands and the CRC32 of the body, then the body: the 5 cards of every hand
+    by strength and one byte of combination type per hand. 
+    The file is replaced at once, so a reader never sees half of it.
+    '''
+
+    body = (''.join(hands_by_strength).encode('ascii') + 
+            bytes(combination_types))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temporary_path, 'wb') as the_file:
+        the_file.write('poker-tables {} {} {} {}\n'.format(
+            TABLES_VERSION, get_tables_fingerprint(), 
+            len(hands_by_strength), zlib.crc32(body)).encode('ascii'))
+        the_file.write(body)
+    os.replace(temporary_path, path)
+
+
+def load_tables(path):
+    ''' Load the evaluation tables saved by save_tables.
+    return: the tables as returned by build_tables, or None if the file is 
+    missing, damaged or stale
+    '''
+
+    try:
+        with open(path, 'rb') as the_file:
+            header = the_file.readline().split()
+            data = the_file.read()
+    except OSError:
+        return(None)
+
+    expected = [b'poker-tables', str(TABLES_VERSION).encode('ascii'), 
+                str(get_tables_fingerprint()).encode('ascii'), 
+                str(POSSIBLE_HANDS).encode('ascii')]
+    if len(header) != 5 or header[:4] != expected or \
+            not header[4].isdigit() or int(header[4]) != zlib.crc32(data):
+        return(None)
+
+    count = POSSIBLE_HANDS
+    if len(data) != 6 * count:
+        return(None)
+
+    text = data[:5 * count].decode('ascii', 'replace')
+    hands_by_strength = [text[i:i + 5] for i in range(0, 5 * count, 5)]
+    combination_types = list(data[5 * count:])
+
+    # distinct canonical hands of possible cards, without five of a kind
+    hands = set(hands_by_strength)
+    if len(hands) != count or not set(text) <= CARD_VALUE.keys() or \
+            hands & {card * 5 for card in CARD_SET} or \
+            list(map(''.join, map(sorted, hands_by_strength))) != \
+            hands_by_strength or \
+            min(combination_types) < 1 or max(combination_types) > 6:
+        return(None)
+
+    return(hands_by_strength, combination_types)
+
+
+def load_or_build_tables():
+    ''' Load the saved evaluation tables, or build and save them when they 
+    are missing or stale. 
+    return: the tables as returned by build_tables
+    '''
+
+    path = get_tables_path()
+    tables = load_tables(path) if path else None
+    if tables is None:
+        tables = build_tables()
+        if path:
+            try:
+                save_tables(path, *tables)
+            except OSError:
+                # a read-only cache directory only makes the start slower
+                pass
+
+    return(tables)
+
+
+# the canonical hand of each strength, from the weakest hand to the strongest,
+# and the combination type of the hand of each strength 
+HANDS_BY_STRENGTH, COMBINATION_TYPE_BY_STRENGTH = load_or_build_tables()
+
+STRENGTH_TABLE = {hand: strength 
+                  for strength, hand in enumerate(HANDS_BY_STRENGTH)}
+
+
+def get_hand_strength(hand):
+    ''' Look up the strength of a hand in the strength table.
+    input: a hand
+    return: the strength of the hand, or -1 if it is not a possible hand
+    '''
+
+    if type(hand) is Hand:
+        return(hand.strength)
+
+    return(STRENGTH_TABLE.get(''.join(sorted(hand)), -1))
+
+
+def get_best_hand(cards):
+    ''' Find the strongest hand of 5 cards among more cards, such as 2 private
+    cards and 5 shared cards. The groups of repeated cards that give the best
+    combination type are taken first and the most valuable other cards fill
+    the rest of the hand.
+    input: at least 5 cards
+    return: the best hand as a string of 5 cards, or '' if the cards are not
+    possible
+    '''
+
+    counts = {}
+    for card in cards:
+        counts[card] = counts.get(card, 0) + 1
+
+    if (len(cards) < 5 or not counts.keys() <= CARD_VALUE.keys() or 
+            max(counts.values()) > 4):
+        return('')
+
+    groups = sorted(counts, key=lambda card: (counts[card], CARD_VALUE[card]), 
+                    reverse=True)
+    first, second = counts[groups[0]], counts[groups[1]]
+
+    if first == 4:
+        repeated = (4,)
+    elif first == 3 and second >= 2:
+        repeated = (3, 2)
+    elif first == 3:
+        repeated = (3,)
+    elif first == 2 and second == 2:
+        repeated = (2, 2)
+    elif first == 2:
+        repeated = (2,)
+    else:
+        repeated = ()
+
+    hand = ''.join(card * count for card, count in zip(groups, repeated))
+    kickers = sorted(groups[len(repeated):], key=CARD_VALUE.get, reverse=True)
+
+    return(hand + ''.join(kickers[:5 - len(hand)]))
+
+
+# the strength of the best hand of the sorted cards that have been looked up
+# by get_best_strength. Only possible cards of at most MAX_BEST_CARDS are 
+# added, so it is bounded by the number of multisets of 5 to 7 cards, about 
+# 50,000. 
+BEST_STRENGTH_TABLE = {}
+MAX_BEST_CARDS = 7
+
+
+def get_best_strength(cards):
+    ''' Look up the strength of the best hand of 5 cards among more cards.
+    input: 5 to MAX_BEST_CARDS cards
+    return: the strength of the best hand, or -1 if the cards are not possible
+    or too many
+    '''
+
+    if len(cards) > MAX_BEST_CARDS:
+        return(-1)
+
+    canonical = ''.join(sorted(cards))
+    strength = BEST_STRENGTH_TABLE.get(canonical)
+    if strength is None:
+        strength = get_hand_strength(get_best_hand(canonical))
+        if strength >= 0:
+            BEST_STRENGTH_TABLE[canonical] = strength
+
+    return(strength)
+
+
+# a hand packed into one integer holds the number of cards of each value in 4
+# bits, in the order of CARD_SET: 13 values take 52 bits. Adding the packed 
+# cards of two hands merges them. 
+PACKED_CARD = {card: 1 << (4 * index) for index, card in enumerate(CARD_SET)}
+# 3 and the high bit in every 4 bits of the values, to check all counts at once
+PACKED_THREES = sum(3 * bit for bit in PACKED_CARD.values())
+PACKED_HIGH_BITS = sum(8 * bit for bit in PACKED_CARD.values())
+
+STRENGTH_BY_PACKED = {sum(map(PACKED_CARD.__getitem__, hand)): strength 
+                      for strength, hand in enumerate(HANDS_BY_STRENGTH)}
+
+
+def pack_hand(cards):
+    ''' Pack the cards of a hand into one integer.
+    input: any number of cards, at most 15 of each value
+    return: the packed integer
+    '''
+
+    if not isinstance(cards, str):
+        cards = list(cards)
+    try:
+        packed = sum(map(PACKED_CARD.__getitem__, cards))
+    except KeyError as error:
+        raise ValueError('{!r} is not a card'.format(error.args[0]))
+
+    # a 16th card of a value would carry into the 4 bits of the next value
+    if len(cards) > 15 and max(collections.Counter(cards).values()) > 15:
+        raise ValueError('More than 15 cards of one value cannot be packed')
+
+    return(packed)
+
+
+def unpack_hand(packed):
+    ''' Unpack the cards of a packed hand.
+    return: the cards as a string, from the most valuable to the least
+    '''
+
+    return(''.join(card * ((packed >> (4 * index)) & 15) 
+                   for index, card in reversed(list(enumerate(CARD_SET)))))
+
+
+def add_card(packed, card):
+    ''' Add one card to a packed hand.
+    return: the packed hand with the card
+    '''
+
+    if packed & (15 * PACKED_CARD[card]) == 15 * PACKED_CARD[card]:
+        raise ValueError('The hand already contains 15 {!r}'.format(card))
+
+    return(packed + PACKED_CARD[card])
+
+
+def remove_card(packed, card):
+    ''' Remove one card from a packed hand.
+    return: the packed hand without the card
+    '''
+
+    if not packed & (15 * PACKED_CARD[card]):
+        raise ValueError('The hand does not contain {!r}'.format(card))
+
+    return(packed - PACKED_CARD[card])
+
+
+def is_valid_packed(packed):
+    ''' Check that no value of a packed hand has more than 4 cards: adding
+    3 to a count of 5 to 7 sets its high bit, which is already set from 8. 
+    '''
+
+    return(packed >= 0 and 
+           not (packed | (packed + PACKED_THREES)) & PACKED_HIGH_BITS)
+
+
+def merge_packed(packed_1, packed_2):
+    ''' Merge two packed hands, such as private and shared cards.
+    return: the packed cards of both, or -1 if more than 4 cards of a value
+    are merged
+    '''
+
+    packed = packed_1 + packed_2
+
+    return(packed if is_valid_packed(packed) else -1)
+
+
+def count_packed_cards(packed):
+    ''' Count the cards of a packed hand. '''
+
+    count = 0
+    while packed:
+        count += packed & 15
+        packed >>= 4
+
+    return(count)
+
+
+def get_packed_strength(packed):
+    ''' Look up the strength of a packed hand.
+    return: the strength, or -1 if it is not a possible hand
+    '''
+
+    return(STRENGTH_BY_PACKED.get(packed, -1))
+
+
+def pack_hands(hands):
+    ''' Pack hands into an array of 64 bit integers, to store them or to send
+    them to another process. 
+    input: an iterable of hands
+    return: an array('Q') of packed hands
+    '''
+
+    return(array.array('Q', map(pack_hand, hands)))
+
+
+def get_packed_strengths(packed_hands):
+    ''' Look up the strengths of packed hands.
+    input: an iterable of packed hands, such as an array('Q')
+    return: an array('h') of strengths, -1 for the hands that are not 
+    possible
+    '''
+
+    return(array.array('h', map(STRENGTH_BY_PACKED.get, packed_hands, 
+                                itertools.repeat(-1))))
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 
+                                                 'evictions', 'maxsize', 
+                                                 'currsize'])
+
+
+class LRUCache(object):
+    ''' A thread-safe cache that evicts the least recently used entry when it
+    is full, and counts its hits, misses and evictions. 
+    '''
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.maxsize = maxsize
+        # threading is only imported by the programs that use the cache
+        import threading
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self):
+        return(len(self._entries))
+
+    def get(self, key, default=None):
+        ''' Get the value of a key and mark it as recently used. '''
+
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return(default)
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        return(value)
+
+    def put(self, key, value):
+        ''' Store the value of a key, evicting the least recently used entry 
+        if the cache is full. 
+        '''
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        ''' Remove all entries and reset the statistics. '''
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        ''' Get the statistics of the cache as a CacheInfo. '''
+
+        with self._lock:
+            return(CacheInfo(self._hits, self._misses, self._evictions, 
+                             self.maxsize, len(self._entries)))
+
+
+def enable_cache(maxsize=4096):
+    ''' Cache the results of check_card_combination_type and 
+    poker.get_winer_same_combination. Hands are cached by their canonical 
+    form, so hands with the same cards in a different order share an entry.
+    input: the largest number of entries
+    return: the cache
+    '''
+
+    global hand_cache
+    hand_cache = LRUCache(maxsize)
+
+    return(hand_cache)
+
+
+def disable_cache():
+    ''' Stop caching and drop the cache. '''
+
+    global hand_cache
+    hand_cache = None
+
+
+def cache_info():
+    ''' Get the statistics of the cache, or None if it is not enabled. '''
+
+    return(None if hand_cache is None else hand_cache.info())
+
+
+def cache_clear():
+    ''' Remove all entries of the cache, if it is enabled. '''
+
+    if hand_cache is not None:
+        hand_cache.clear()
@@ -25,12 +25,15 @@ don't have suits and there are no flushes, straights, and straight flushes.
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import collections 
 import sys
 
 import lib_poker as util 
 
 
+# the opt-in instrumentation of who_wins, see poker_metrics.enable
+metrics = None
+
+
 def get_winer_same_combination(hand_1, hand_2, combination_type):
     '''Determine the winner between two sets of cards of the 
     same combination_type.
@@ -41,31 +44,40 @@ def get_winer_same_combination(hand_1, hand_2, combination_type):
         -1: fail
     ''' 
     
-    all_cards_1 = util.order_cards_by_value([c for c in hand_1])
-    all_cards_2 = util.order_cards_by_value([c for c in hand_2])
-    
-    winner = -1
-    if combination_type == 1:   
-        # both hands contain high cards
-        winner = util.get_winner_in_high_card(all_cards_1, all_cards_2)
-    elif combination_type == 2:
-        # both hands contain pair
-        winner = util.get_winner_in_pairs(all_cards_1, all_cards_2)
-    elif combination_type == 3:
-        # both hands contain two pairs
-        winner = util.get_winner_in_two_pairs(all_cards_1, all_cards_2)
-    elif combination_type == 4:
-        # both hands contain triples
-        winner = util.get_winner_in_triples(all_cards_1, all_cards_2)
-    elif combination_type == 5:
-        # both hands contain full house
-        winner = util.get_winner_in_full_house(all_cards_1, all_cards_2)
-    elif combination_type == 6:
-        # both hands contain four of a kind
-        winner = util.get_winner_in_four_a_kind(all_cards_1, all_cards_2)  
-    else:
+    if util.hand_cache is None:
+        return(_get_winer_same_combination(hand_1, hand_2, combination_type))
+
+    key = ('winner', util.get_canonical_hand(hand_1), 
+           util.get_canonical_hand(hand_2), combination_type)
+    winner = util.hand_cache.get(key)
+    if winner is None:
+        winner = _get_winer_same_combination(key[1], key[2], combination_type)
+        util.hand_cache.put(key, winner)
+
+    return(winner)
+
+
+def _get_winer_same_combination(hand_1, hand_2, combination_type):
+    ''' Determine the winner between two sets of cards of the same 
+    combination_type, without the cache.
+    '''
+
+    if combination_type not in util.COMBINATION_TYPE_BY_PATTERN.values():
         # either of the hands may contain invalid card as an input
+        return(-1)
+
+    key_1 = util.hand_key(hand_1)
+    key_2 = util.hand_key(hand_2)
+
+    winner = -1
+    if key_1[0] != combination_type or key_2[0] != combination_type:
         winner = -1
+    elif key_1 > key_2:
+        winner = 1
+    elif key_1 < key_2:
+        winner = 2
+    else:
+        winner = 0
 
     return(winner)
         
@@ -80,34 +92,193 @@ def who_wins(hand_1, hand_2):
         -1: fail
      '''
     
-    # if any of the poker hand does not contain 5 cards, 
-    # or illegal characters, retrun error. 
-    if len(hand_1) != 5 or len(hand_2) != 5 or \
-            not set(hand_1).issubset(util.CARD_SET) or \
-            not set(hand_2).issubset(util.CARD_SET):
+    metrics_ = metrics
+    if metrics_ is not None:
+        start = metrics_.clock()
+
+    # if any of the poker hand does not contain 5 cards, illegal characters 
+    # or five cards of the same value, it is not in the strength table and 
+    # its strength is -1. 
+    strength_1 = util.get_hand_strength(hand_1)
+    strength_2 = util.get_hand_strength(hand_2)
+
+    winner = util.compare_strengths(strength_1, strength_2)
+
+    if metrics_ is not None:
+        metrics_.record(strength_1, strength_2, winner, 
+                        metrics_.clock() - start)
+
+    return(winner)
+
+
+def who_wins_packed(packed_1, packed_2):
+    ''' Determine the winner of two packed poker hands (see 
+    lib_poker.pack_hand). 
+    return: the winner, with the codes of who_wins
+    '''
+
+    return(util.compare_strengths(util.STRENGTH_BY_PACKED.get(packed_1, -1), 
+                                  util.STRENGTH_BY_PACKED.get(packed_2, -1)))
+
+
+def who_wins_shared(private_1, private_2, shared):
+    ''' Determine the winner of two players who share cards, as in hold'em.
+    Each player plays the best hand of 5 cards among their private cards and 
+    the shared cards.
+    input: the private cards of the first and the second player, and the 
+    shared cards
+    return: the winner, with the codes of who_wins
+    '''
+
+    strength_1 = util.get_best_strength(private_1 + shared)
+    strength_2 = util.get_best_strength(private_2 + shared)
+
+    # the cards of both players come from one deck, so together they hold at
+    # most 4 cards of a value
+    if strength_1 >= 0 and strength_2 >= 0 and not util.is_valid_packed(
+            util.pack_hand(private_1 + private_2 + shared)):
         return(-1)
 
-    hand_1_type = util.check_card_combination_type(hand_1)
-    hand_2_type = util.check_card_combination_type(hand_2)
+    return(util.compare_strengths(strength_1, strength_2))
+
+
+def _get_strengths(hands):
+    ''' Look up the strength of every hand, failing on an illegal hand. '''
+
+    strengths = [util.get_hand_strength(hand) for hand in hands]
+    for index, strength in enumerate(strengths):
+        if strength < 0:
+            raise ValueError('Hand {} ({!r}) is not a legal hand'.format(
+                index, hands[index]))
+
+    return(strengths)
+
+
+def showdown(hands):
+    ''' Determine the winners among any number of poker hands.
+    input: a list of hands
+    return: the list of the indices of the winning hands, in input order. 
+    More than one index means the winning hands tie and split the pot. 
+    '''
+
+    strengths = _get_strengths(hands)
+    if not strengths:
+        return([])
+
+    best = max(strengths)
+
+    return([index for index, strength in enumerate(strengths) 
+            if strength == best])
+
+
+def rank_hands(hands):
+    ''' Order any number of poker hands from the strongest to the weakest.
+    input: a list of hands
+    return: a list of groups of hand indices, from the strongest group to the
+    weakest one. The hands in one group tie. 
+    '''
+
+    groups = {}
+    for index, strength in enumerate(_get_strengths(hands)):
+        groups.setdefault(strength, []).append(index)
+
+    return([groups[strength] for strength in sorted(groups, reverse=True)])
+
+
+def check_hands(hand_1, hand_2):
+    ''' Check that both hands contain five legal cards. 
+    input: cards in the first hand and the second hand
+    return: an error message, or None if both hands are legal
+    '''
+
+    # Check if a hand contains five cards.
+    if len(hand_1) != 5:
+        return('The first hand must contain 5 cards. Please try again.')
     
-    winner = -1
+    if len(hand_2) != 5:
+        return('The second hand must contain 5 cards. Please try again.')
     
-    if hand_1_type > hand_2_type:
-        # simple scenario - the hands contain different combination type. 
-        winner = 1
-    elif hand_1_type < hand_2_type:
-        winner = 2
-    else: 
-        # similar combination type
-        winner = get_winer_same_combination(hand_1, hand_2, hand_1_type)    
+    # Check if a hand contains invalid cards. 
+    if  not set(hand_1).issubset(util.CARD_SET):
+        return('The fist hand contain invalid cards')
 
-    return(winner)
+    if  not set(hand_2).issubset(util.CARD_SET):
+        return('The second hand contain invalid cards')
+
+    return(None)
+
+
+def read_matchups(lines):
+    ''' Split lines of the form "{hand_1} {hand_2}" into pairs of hands.
+    input: an iterable of lines, such as an open file
+    return: a generator of (hand_1, hand_2, error) where error is None for 
+    a legal pair of hands and an error message otherwise
+    '''
+
+    for line in lines:
+        hands = line.upper().split()
+        if len(hands) != 2:
+            yield(None, None, 'Please insert cards in hand_1 and hand_2')
+            continue
+
+        hand_1, hand_2 = hands
+        yield(hand_1, hand_2, check_hands(hand_1, hand_2))
+
+
+def evaluate_matchups(matchups):
+    ''' Determine the winner of each pair of hands.
+    input: an iterable of (hand_1, hand_2, error) as given by read_matchups
+    return: a generator of one result message for each pair of hands
+    '''
+
+    who_wins_ = who_wins
+    winner_msg = util.WINNER_MSG
+    for hand_1, hand_2, error in matchups:
+        if error is None:
+            yield(winner_msg[who_wins_(hand_1, hand_2)])
+        else:
+            yield('Error: ' + error)
+
+
+def run_batch(in_file, out_file, buffer_lines=4096):
+    ''' Read one pair of hands per line from in_file and write one result 
+    per line to out_file. A line with illegal hands gets an error message and
+    does not stop the batch.
+    input: the input and output files, and the number of result lines that 
+    are buffered before each write
+    return: the number of lines processed
+    '''
+
+    count = 0
+    buffer = []
+    for result in evaluate_matchups(read_matchups(in_file)):
+        buffer.append(result)
+        if len(buffer) >= buffer_lines:
+            out_file.write('\n'.join(buffer) + '\n')
+            count += len(buffer)
+            buffer = []
+
+    if buffer:
+        out_file.write('\n'.join(buffer) + '\n')
+        count += len(buffer)
+    out_file.flush()
+
+    return(count)
 
 
 if __name__ == '__main__':
     '''Main function
     '''
 
+    # batch mode: one pair of hands per line from a file or stdin
+    if len(sys.argv) > 1 and sys.argv[1] in ('-b', '--batch'):
+        if len(sys.argv) < 3 or sys.argv[2] == '-':
+            run_batch(sys.stdin, sys.stdout)
+        else:
+            with open(sys.argv[2]) as in_file:
+                run_batch(in_file, sys.stdout)
+        sys.exit()
+
     # check for user inputs
     if len(sys.argv) < 3:
         sys.exit('Please insert cards in hand_1 and hand_2')
@@ -115,24 +286,12 @@ if __name__ == '__main__':
     hand_1 = sys.argv[1].upper()
     hand_2 = sys.argv[2].upper()
        
-    # Check if a hand contains five cards.
-    if len(hand_1) != 5:
-            sys.exit('The first hand must contain 5 cards. Please try again.')
-    
-    if len(hand_2) != 5:
-        sys.exit('The second hand must contain 5 cards. Please try again.')
-    
     #print('First hand: {} \nSecond hand: {}'.format(hand_1, hand_2))
     
-    # Check if a hand contains invalid cards. 
-    if  not set(hand_1).issubset(util.CARD_SET):
-        sys.exit('The fist hand contain invalid cards')
-
-    if  not set(hand_2).issubset(util.CARD_SET):
-        sys.exit('The second hand contain invalid cards')
+    error = check_hands(hand_1, hand_2)
+    if error:
+        sys.exit(error)
 
     winner = who_wins(hand_1, hand_2)
 
     util.print_winner_message(winner)
-
-
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A compact binary file format for pairs of hands of the simplified poker game.
+Each hand is stored as its 16-bit index among the multisets of 5 cards, from
+poker_shared.get_index, so a pair of hands takes 4 bytes. The index does not
+depend on the evaluation tables, so archived files stay readable when the 
+tables change. The winners are determined directly from a memory-mapped file,
+through a table of the strength of each index, without creating a string per
+hand.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import array
+import mmap
+import struct
+import sys
+
+import lib_poker as util 
+import poker_shared
+
+
+# a file starts with the magic bytes and the format version, followed by the
+# codes of the first and the second hand of each pair as little-endian 
+# unsigned 16-bit integers. The code of a hand is its index from 
+# poker_shared.get_index. 
+MAGIC = b'PKRM'
+VERSION = 3
+HEADER = struct.Struct('<4sI')
+
+# the code that is stored for an impossible hand
+INVALID_CODE = 0xFFFF
+
+# the strength of the hand of each code below poker_shared.INDEX_SIZE, -1 for
+# the impossible hands
+STRENGTH_BY_CODE = [-1 if strength == poker_shared.INVALID_STRENGTH else 
+                    strength for strength in poker_shared.build_strengths()]
+
+BUFFER_PAIRS = 1 << 16
+
+
+def encode_hand(hand):
+    ''' Get the 16-bit code of a hand in the binary format.
+    input: a hand
+    return: the index of the hand, or INVALID_CODE
+    '''
+
+    code = poker_shared.get_index(hand)
+
+    return(code if code >= 0 and STRENGTH_BY_CODE[code] >= 0 else 
+           INVALID_CODE)
+
+
+def decode_hand(code):
+    ''' Get the canonical hand of a 16-bit code of the binary format.
+    input: a code
+    return: the canonical hand, or None for INVALID_CODE or another code of 
+    an impossible hand
+    '''
+
+    if code >= len(STRENGTH_BY_CODE) or STRENGTH_BY_CODE[code] < 0:
+        return(None)
+
+    return(util.HANDS_BY_STRENGTH[STRENGTH_BY_CODE[code]])
+
+
+def _write_codes(the_file, codes):
+    ''' Write an array of 16-bit codes in little-endian byte order. '''
+
+    if sys.byteorder != 'little':
+        codes.byteswap()
+    the_file.write(codes.tobytes())
+
+
+def write_matchups(path, matchups):
+    ''' Write pairs of hands to a binary file.
+    input: the path of the file and an iterable of (hand_1, hand_2)
+    return: the number of pairs written
+    '''
+
+    count = 0
+    codes = array.array('H')
+    with open(path, 'wb') as the_file:
+        the_file.write(HEADER.pack(MAGIC, VERSION))
+        for hand_1, hand_2 in matchups:
+            codes.append(encode_hand(hand_1))
+            codes.append(encode_hand(hand_2))
+            if len(codes) >= 2 * BUFFER_PAIRS:
+                _write_codes(the_file, codes)
+                count += len(codes) // 2
+                codes = array.array('H')
+
+        _write_codes(the_file, codes)
+        count += len(codes) // 2
+
+    return(count)
+
+
+def convert_text_file(text_path, binary_path):
+    ''' Convert a text file with one pair of hands per line, as read by the 
+    batch mode of poker.py, to a binary file. A line that does not contain 
+    two hands is stored as a pair of impossible hands.
+    return: the number of pairs written
+    '''
+
+    def read_pairs(lines):
+        for line in lines:
+            hands = line.upper().split()
+            yield(hands if len(hands) == 2 else ('', ''))
+
+    with open(text_path) as text_file:
+        return(write_matchups(binary_path, read_pairs(text_file)))
+
+
+class MatchupFile(object):
+    ''' A memory-mapped binary file of pairs of hands. 
+
+    The codes of the hands are read straight from the mapped file, so the 
+    winners are determined without copying the file or creating strings.
+    '''
+
+    def __init__(self, path):
+        with open(path, 'rb') as the_file:
+            self._mmap = mmap.mmap(the_file.fileno(), 0, 
+                                   access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError('{} is not a version {} matchup file'.format(
+                    path, VERSION))
+            if HEADER.unpack_from(self._mmap) != (MAGIC, VERSION):
+                raise ValueError('{} is not a version {} matchup file'.format(
+                    path, VERSION))
+            if (len(self._mmap) - HEADER.size) % 4:
+                raise ValueError('{} is truncated'.format(path))
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        if sys.byteorder == 'little':
+            self._codes = memoryview(self._mmap)[HEADER.size:].cast('H')
+        else:
+            # a big-endian machine needs a swapped copy of the codes
+            self._codes = array.array('H', self._mmap[HEADER.size:])
+            self._codes.byteswap()
+
+    def __len__(self):
+        return(len(self._codes) // 2)
+
+    def __getitem__(self, index):
+        ''' Get the canonical hands of a pair, None for an impossible hand. '''
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('matchup index out of range')
+
+        return(decode_hand(self._codes[2 * index]), 
+               decode_hand(self._codes[2 * index + 1]))
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        ''' Release the memory-mapped file. '''
+
+        if isinstance(self._codes, memoryview):
+            self._codes.release()
+        self._mmap.close()
+
+    def iter_winners(self):
+        ''' Determine the winner of each pair of hands.
+        return: a generator of the winners, with the codes of poker.who_wins
+        '''
+
+        compare_strengths = util.compare_strengths
+        strengths = STRENGTH_BY_CODE
+        size = len(strengths)
+        codes = iter(self._codes)
+        for code_1, code_2 in zip(codes, codes):
+            # INVALID_CODE and the codes of a damaged file are out of the 
+            # table
+            if code_1 >= size or code_2 >= size:
+                yield(-1)
+            else:
+                yield(compare_strengths(strengths[code_1], strengths[code_2]))
+
+    def winners(self):
+        ''' Determine the winner of each pair of hands.
+        return: an array of the winners, in file order
+        '''
+
+        return(array.array('b', self.iter_winners()))
+
+    def summary(self):
+        ''' Count the winners of the pairs of hands. 
+        return: a dictionary of winner -> number of pairs
+        '''
+
+        summary = dict.fromkeys(util.WINNER_MSG, 0)
+        for winner in self.iter_winners():
+            summary[winner] += 1
+
+        return(summary)
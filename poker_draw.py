@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A discard optimizer for a five-card draw variant of the simplified poker 
+game. For each of the 32 ways to discard cards from a hand it computes the 
+exact probabilities to win, tie and lose against an opponent hand after the 
+discarded cards are replaced from the rest of the deck.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import collections
+import functools
+import math
+import operator
+
+import lib_poker as util 
+import poker_equity
+
+
+DrawOption = collections.namedtuple('DrawOption', ['discard', 'win', 'tie', 
+                                                   'loss', 'equity'])
+
+
+def reference_distribution():
+    ''' Get the probability of each strength of an opponent hand dealt from a
+    full deck.
+    return: a list of probabilities indexed by strength
+    '''
+
+    deck = poker_equity.get_deck()
+    combinations = poker_equity.COMBINATIONS[poker_equity.CARDS_PER_VALUE]
+    total = math.comb(sum(deck), 5)
+
+    return([math.prod(combinations[hand.count(card)] for card in set(hand)) / 
+            total for hand in util.HANDS_BY_STRENGTH])
+
+
+def get_outcome_tables(opponent):
+    ''' Get the probabilities to win and to tie of each hand against an 
+    opponent.
+    input: the probability (or weight) of each strength of the opponent hand
+    return: two dicts from the packed hand (see lib_poker.pack_hand) to the 
+    probability to win and to tie
+    '''
+
+    if len(opponent) != len(util.HANDS_BY_STRENGTH):
+        raise ValueError('opponent needs one weight per strength')
+    total = sum(opponent)
+
+    win_by_counts = {}
+    tie_by_counts = {}
+    below = 0.0
+    # the packed hands are in the order of their strength
+    for packed, strength in util.STRENGTH_BY_PACKED.items():
+        win_by_counts[packed] = below
+        tie_by_counts[packed] = opponent[strength] / total
+        below += opponent[strength] / total
+
+    return(win_by_counts, tie_by_counts)
+
+
+@functools.lru_cache(maxsize=None)
+def get_reference_tables():
+    ''' Get the outcome tables against the reference_distribution. '''
+
+    return(get_outcome_tables(reference_distribution()))
+
+
+def get_draws(deck):
+    ''' Enumerate the multisets of cards that can be drawn from a deck. Each
+    multiset extends a smaller one by one card, adding the packed card to the
+    packed hand. 
+    input: the number of cards of each value in the deck, in the order of 
+    CARD_SET
+    return: a list indexed by the number of drawn cards, from 0 to 5, of 
+    (packed hands, ways) lists, where ways is the number of card combinations
+    of the deck that give the multiset
+    '''
+
+    bits = [util.PACKED_CARD[card] for card in util.CARD_SET]
+    # the draws of one size grouped by the index of their highest card value
+    # and the number of cards of this value
+    groups = {(-1, 0): ([0], [1])}
+    draws = [([0], [1])]
+    for size in range(5):
+        extended = collections.defaultdict(lambda: ([], []))
+        for (last, run), (packed, ways) in groups.items():
+            if last >= 0 and deck[last] > run:
+                target = extended[(last, run + 1)]
+                left = deck[last] - run
+                target[0].extend([item + bits[last] for item in packed])
+                target[1].extend([item * left // (run + 1) for item in ways])
+            for index in range(last + 1, len(deck)):
+                if deck[index]:
+                    target = extended[(index, 1)]
+                    target[0].extend([item + bits[index] for item in packed])
+                    target[1].extend([item * deck[index] for item in ways])
+        groups = extended
+        draws.append(([item for packed, _ in groups.values() 
+                       for item in packed], 
+                      [item for _, ways in groups.values() for item in ways]))
+
+    return(draws)
+
+
+def evaluate_discards(hand, opponent=None):
+    ''' Compute the exact outcome of every way to discard cards from a hand.
+    input: a hand of 5 cards and the probability (or weight) of each strength
+    of the opponent hand, by default that of a hand dealt from a full deck
+    return: a list of 32 DrawOption(discard, win, tie, loss, equity), one per
+    subset of discarded cards, from the best equity (win + tie / 2) to the 
+    worst. discard is the string of the discarded cards, in hand order. 
+    '''
+
+    if util.get_hand_strength(hand) < 0:
+        raise ValueError('{!r} is not a possible hand'.format(hand))
+    cards = ''.join(hand)
+
+    if opponent is None:
+        win_by_counts, tie_by_counts = get_reference_tables()
+    else:
+        win_by_counts, tie_by_counts = get_outcome_tables(opponent)
+
+    # the discarded cards are not shuffled back into the deck
+    deck = poker_equity.get_deck(cards)
+    draws = get_draws(deck)
+    deck_size = sum(deck)
+
+    outcomes = {}
+    options = []
+    for mask in range(32):
+        discard = ''.join(card for position, card in enumerate(cards) 
+                          if mask & (1 << position))
+        kept = util.pack_hand(card for position, card in enumerate(cards) 
+                           if not mask & (1 << position))
+
+        # discards that keep the same cards have the same outcome
+        if kept not in outcomes:
+            packed, ways = draws[len(discard)]
+            hands = [kept + item for item in packed]
+            total = math.comb(deck_size, len(discard))
+            win = sum(map(operator.mul, ways, 
+                          map(win_by_counts.__getitem__, hands))) / total
+            tie = sum(map(operator.mul, ways, 
+                          map(tie_by_counts.__getitem__, hands))) / total
+            outcomes[kept] = (win, tie)
+
+        win, tie = outcomes[kept]
+        options.append(DrawOption(discard, win, tie, max(1.0 - win - tie, 0.0),
+                                  win + tie / 2))
+
+    options.sort(key=lambda option: -option.equity)
+
+    return(options)
+
+
+def best_discard(hand, opponent=None):
+    ''' Find the discard with the best equity. 
+    return: the best DrawOption, see evaluate_discards
+    '''
+
+    return(evaluate_discards(hand, opponent)[0])
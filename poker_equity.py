@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""Exact equity of hands of the simplified poker game. The deck holds 4 cards of
+each of the 13 values, and the probabilities are computed by enumerating the 
+multisets of card values with their number of ways to be dealt, instead of 
+every combination of cards of the deck.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import array
+import bisect
+import collections
+import functools
+import math
+import os
+import sys
+import zlib
+
+import lib_poker as util 
+
+
+# the number of cards of each value in the deck
+CARDS_PER_VALUE = 4
+
+Equity = collections.namedtuple('Equity', ['win', 'tie', 'loss'])
+
+# COMBINATIONS[n][k] is the number of ways to pick k of n cards
+COMBINATIONS = [[math.comb(n, k) for k in range(CARDS_PER_VALUE + 1)] 
+                for n in range(CARDS_PER_VALUE + 1)]
+
+# the groups of repeated cards of every hand, from the weakest hand to the 
+# strongest, as indices card index * 5 + count into the table built by
+# count_outcomes. The hands of one combination type are next to each other 
+# and have the same number of groups, so they are stored in one list per 
+# combination type.
+GROUPS_BY_TYPE = []
+for _hand in util.HANDS_BY_STRENGTH:
+    _groups = tuple(util.CARD_SET.index(card) * (CARDS_PER_VALUE + 1) + 
+                    _hand.count(card) for card in sorted(set(_hand)))
+    if not GROUPS_BY_TYPE or len(GROUPS_BY_TYPE[-1][0]) != len(_groups):
+        GROUPS_BY_TYPE.append([])
+    GROUPS_BY_TYPE[-1].append(_groups)
+del _hand, _groups
+
+# the same groups as one list indexed by strength
+GROUPS_BY_STRENGTH = [groups for type_groups in GROUPS_BY_TYPE 
+                      for groups in type_groups]
+
+
+def get_deck(*removed):
+    ''' Count the cards of each value that are left in the deck.
+    input: strings of the cards removed from the deck
+    return: a list of 13 counts, in the order of CARD_SET
+    '''
+
+    deck = [CARDS_PER_VALUE] * len(util.CARD_SET)
+    for cards in removed:
+        for card in cards:
+            if card not in util.CARD_VALUE:
+                raise ValueError('{!r} is not a card'.format(card))
+            deck[util.CARD_SET.index(card)] -= 1
+
+    if min(deck) < 0:
+        raise ValueError('More than {} cards of one value are removed'.format(
+            CARDS_PER_VALUE))
+
+    return(deck)
+
+
+def iter_draws(deck, size, start=0):
+    ''' Enumerate the multisets of cards that can be drawn from a deck.
+    input: the counts of the cards in the deck, the number of cards to draw 
+    return: a generator of (cards, ways) where cards is a string and ways is 
+    the number of card combinations of the deck that give these cards
+    '''
+
+    if size == 0:
+        yield('', 1)
+        return
+
+    for index in range(start, len(deck)):
+        for count in range(1, min(deck[index], size) + 1):
+            ways = COMBINATIONS[deck[index]][count]
+            for cards, rest_ways in iter_draws(deck, size - count, index + 1):
+                yield(util.CARD_SET[index] * count + cards, ways * rest_ways)
+
+
+def _sum_weights(table, start, stop):
+    ''' Sum the ways to deal the hands from strength start to stop - 1.
+    input: the table built by count_outcomes and the range of strengths
+    return: the number of ways
+    '''
+
+    total = 0
+    offset = 0
+    for groups in GROUPS_BY_TYPE:
+        part = groups[max(start - offset, 0):max(stop - offset, 0)]
+        offset += len(groups)
+        if not part:
+            continue
+
+        if len(part[0]) == 5:
+            total += sum([table[a] * table[b] * table[c] * table[d] * 
+                          table[e] for a, b, c, d, e in part])
+        elif len(part[0]) == 4:
+            total += sum([table[a] * table[b] * table[c] * table[d] 
+                          for a, b, c, d in part])
+        elif len(part[0]) == 3:
+            total += sum([table[a] * table[b] * table[c] 
+                          for a, b, c in part])
+        else:
+            total += sum([table[a] * table[b] for a, b in part])
+
+    return(total)
+
+
+def count_outcomes(strength, deck):
+    ''' Count the opponent hands that a hand beats, ties and loses to.
+    input: the strength of the hand and the counts of the cards left in the 
+    deck, from which the opponent hand is dealt
+    return: the numbers of ways (win, tie, loss)
+    '''
+
+    # table[index * 5 + count] is the number of ways to deal count cards of 
+    # the card at index from the deck
+    table = []
+    for cards in deck:
+        table.extend(COMBINATIONS[cards])
+
+    # every deal of 5 cards is one of the possible hands, so only the hands 
+    # on the shorter side of the strength are weighed and the other side is 
+    # what is left of all the deals
+    total = math.comb(sum(deck), 5)
+    tie = math.prod([table[group] for group in GROUPS_BY_STRENGTH[strength]])
+    if strength < len(GROUPS_BY_STRENGTH) // 2:
+        win = _sum_weights(table, 0, strength)
+        loss = total - win - tie
+    else:
+        loss = _sum_weights(table, strength + 1, len(GROUPS_BY_STRENGTH))
+        win = total - loss - tie
+
+    return(win, tie, loss)
+
+
+def _count_ties(deck):
+    ''' Count the deals of two hands from the same deck that tie.
+    input: the counts of the cards in the deck
+    return: the number of ways
+    '''
+
+    ties = 0
+    for groups in GROUPS_BY_STRENGTH:
+        ways = 1
+        for group in groups:
+            index, count = divmod(group, CARDS_PER_VALUE + 1)
+            if deck[index] < 2 * count:
+                break
+            ways *= (COMBINATIONS[deck[index]][count] * 
+                     COMBINATIONS[deck[index] - count][count])
+        else:
+            ties += ways
+
+    return(ties)
+
+
+# the version of the file format of the saved outcomes, see save_outcomes
+OUTCOMES_VERSION = 1
+
+
+def build_outcomes():
+    ''' Count the outcomes of every hand against an opponent hand dealt from
+    the rest of the deck.
+    return: an array('I') of the numbers of ways (win, tie, loss) of each 
+    strength, one after the other
+    '''
+
+    outcomes = array.array('I')
+    for strength, hand in enumerate(util.HANDS_BY_STRENGTH):
+        outcomes.extend(count_outcomes(strength, get_deck(hand)))
+
+    return(outcomes)
+
+
+def get_outcomes_path():
+    ''' Get the path of the file of the saved outcomes, next to the saved 
+    tables of lib_poker.
+    return: the path, or None if the tables are not saved
+    '''
+
+    path = util.get_tables_path()
+    if path is None:
+        return(None)
+
+    return(os.path.join(os.path.dirname(path), 
+                        'outcomes-v{}.bin'.format(OUTCOMES_VERSION)))
+
+
+def save_outcomes(path, outcomes):
+    ''' Save the outcomes of build_outcomes to a file. The file holds a 
+    header line with the format version, the fingerprint of the rules, the 
+    number of hands and the CRC32 of the body, then the body: the outcomes as
+    little-endian unsigned 32-bit integers. 
+    The file is replaced at once, so a reader never sees half of it.
+    '''
+
+    outcomes = array.array('I', outcomes)
+    if sys.byteorder != 'little':
+        outcomes.byteswap()
+    body = outcomes.tobytes()
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temporary_path, 'wb') as the_file:
+        the_file.write('poker-outcomes {} {} {} {}\n'.format(
+            OUTCOMES_VERSION, util.get_tables_fingerprint(), 
+            len(outcomes) // 3, zlib.crc32(body)).encode('ascii'))
+        the_file.write(body)
+    os.replace(temporary_path, path)
+
+
+def load_outcomes(path):
+    ''' Load the outcomes saved by save_outcomes.
+    return: the outcomes as returned by build_outcomes, or None if the file 
+    is missing, damaged or stale
+    '''
+
+    try:
+        with open(path, 'rb') as the_file:
+            header = the_file.readline().split()
+            data = the_file.read()
+    except OSError:
+        return(None)
+
+    expected = [b'poker-outcomes', str(OUTCOMES_VERSION).encode('ascii'), 
+                str(util.get_tables_fingerprint()).encode('ascii'), 
+                str(util.POSSIBLE_HANDS).encode('ascii')]
+    if len(header) != 5 or header[:4] != expected or \
+            not header[4].isdigit() or int(header[4]) != zlib.crc32(data) or \
+            len(data) != 3 * 4 * util.POSSIBLE_HANDS:
+        return(None)
+
+    outcomes = array.array('I')
+    if outcomes.itemsize != 4:
+        return(None)
+    outcomes.frombytes(data)
+    if sys.byteorder != 'little':
+        outcomes.byteswap()
+
+    return(outcomes)
+
+
+@functools.lru_cache(maxsize=None)
+def get_outcomes():
+    ''' Load the saved outcomes of every hand, or build and save them when 
+    they are missing or stale. It takes about a second and a half to build 
+    them, so it is done on the first use only.
+    return: the outcomes as returned by build_outcomes
+    '''
+
+    path = get_outcomes_path()
+    outcomes = load_outcomes(path) if path else None
+    if outcomes is None:
+        outcomes = build_outcomes()
+        if path:
+            try:
+                save_outcomes(path, outcomes)
+            except OSError:
+                # a read-only cache directory only makes the first use slower
+                pass
+
+    return(outcomes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _exact_equity(known, dead):
+    deck = get_deck(known, dead)
+
+    if not known:
+        # both hands are dealt from the same deck, so the hand wins exactly
+        # as often as it loses and only the ties need to be counted
+        cards = sum(deck)
+        total = math.comb(cards, 5) * math.comb(cards - 5, 5)
+        tie = _count_ties(deck)
+        return(Equity((total - tie) / 2 / total, tie / total, 
+                      (total - tie) / 2 / total))
+
+    if not dead:
+        # the outcomes of a full hand only depend on the hand, so the 
+        # outcomes of every completion of the known cards are looked up
+        outcomes = get_outcomes()
+        win = tie = loss = 0
+        for cards, ways in iter_draws(deck, 5 - len(known)):
+            strength = util.get_hand_strength(known + cards)
+            if strength < 0:
+                continue
+            win += ways * outcomes[3 * strength]
+            tie += ways * outcomes[3 * strength + 1]
+            loss += ways * outcomes[3 * strength + 2]
+        total = win + tie + loss
+        return(Equity(win / total, tie / total, loss / total))
+
+    win = tie = loss = 0
+    for cards, ways in iter_draws(deck, 5 - len(known)):
+        hand = known + cards
+        strength = util.get_hand_strength(hand)
+        if strength < 0:
+            continue
+
+        hand_win, hand_tie, hand_loss = count_outcomes(strength, 
+                                                       get_deck(hand, dead))
+        win += ways * hand_win
+        tie += ways * hand_tie
+        loss += ways * hand_loss
+
+    total = win + tie + loss
+
+    return(Equity(win / total, tie / total, loss / total))
+
+
+def exact_equity(known, dead=''):
+    ''' Compute the exact probabilities that a hand wins, ties and loses 
+    against an opponent hand dealt from the rest of the deck.
+    input: the known cards of the hand, up to 5 of them, and optionally the
+    cards that are known to be out of the deck. The missing cards of the 
+    hand are dealt from the deck as well.
+    return: an Equity(win, tie, loss) of probabilities
+
+    Without dead cards, the outcomes of the full hands come from the table 
+    of get_outcomes, and a call takes at most about 5 ms. The first call 
+    builds and saves that table, once. With dead cards the opponent hands 
+    are weighed again for every completion of the hand, so the time grows 
+    with the number of missing cards: about 20 ms with 3 known cards, 100 ms
+    with 2 and 0.5 s with a single known card. The results are memoized, so 
+    later calls with the same cards are free.
+    '''
+
+    if len(known) > 5:
+        raise ValueError('A hand contains at most 5 cards')
+
+    return(_exact_equity(util.get_canonical_hand(known), 
+                         util.get_canonical_hand(dead)))
+
+
+class HandRange(object):
+    ''' A weighted range of opponent hands, indexed by strength to answer the
+    equity of any number of hands against it. 
+    '''
+
+    def __init__(self, hands, weights=None):
+        ''' Index a range of hands.
+        input: the hands of the range and optionally their weights, 1 each
+        by default. A hand may appear more than once. 
+        '''
+
+        if weights is None:
+            weights = [1] * len(hands)
+        if len(weights) != len(hands):
+            raise ValueError('The range needs one weight per hand')
+
+        weight_by_strength = collections.Counter()
+        for hand, weight in zip(hands, weights):
+            strength = util.get_hand_strength(hand)
+            if strength < 0:
+                raise ValueError('{!r} is not a possible hand'.format(hand))
+            if weight < 0:
+                raise ValueError('The weight of {!r} is negative'.format(hand))
+            weight_by_strength[strength] += weight
+
+        # the distinct strengths of the range, from the weakest, and the
+        # total weight of the hands weaker than each of them
+        self.strengths = sorted(weight_by_strength)
+        self.cumulative_weights = [0]
+        for strength in self.strengths:
+            self.cumulative_weights.append(self.cumulative_weights[-1] + 
+                                           weight_by_strength[strength])
+        self.total_weight = self.cumulative_weights[-1]
+        if self.total_weight <= 0:
+            raise ValueError('The range has no weight')
+
+    def equity(self, hand):
+        ''' Compute the probabilities that a hand wins, ties and loses 
+        against the range.
+        input: a hand
+        return: an Equity(win, tie, loss) of probabilities
+        '''
+
+        strength = util.get_hand_strength(hand)
+        if strength < 0:
+            raise ValueError('{!r} is not a possible hand'.format(hand))
+
+        start = bisect.bisect_left(self.strengths, strength)
+        end = start
+        if end < len(self.strengths) and self.strengths[end] == strength:
+            end += 1
+
+        win = self.cumulative_weights[start]
+        tie = self.cumulative_weights[end] - win
+
+        return(Equity(win / self.total_weight, tie / self.total_weight, 
+                      (self.total_weight - win - tie) / self.total_weight))
+
+    def weights_by_strength(self):
+        ''' Get the weight of the range at each strength, as the opponent
+        of poker_draw.evaluate_discards.
+        return: a list of weights indexed by strength
+        '''
+
+        weights = [0] * len(util.HANDS_BY_STRENGTH)
+        for index, strength in enumerate(self.strengths):
+            weights[strength] = (self.cumulative_weights[index + 1] - 
+                                 self.cumulative_weights[index])
+
+        return(weights)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A bulk reader and writer of matchup files of the simplified poker game in CSV
+or JSON Lines format. The files may hold other columns, such as game IDs and
+timestamps, which are copied to the output next to the winner of each row. 
+The rows are read, evaluated and written in chunks, so the memory used does 
+not grow with the size of the file.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+
+import lib_poker as util 
+
+
+HAND_COLUMNS = ('hand_1', 'hand_2')
+RESULT_COLUMN = 'winner'
+CHUNK_ROWS = 65536
+# the size of the buffers of the files opened by the command line
+FILE_BUFFER_BYTES = 1 << 20
+
+
+def evaluate_pairs(hands_1, hands_2):
+    ''' Determine the winners of two lists of hands, pair by pair, as 
+    poker.who_wins does.
+    input: two lists of hands
+    return: a list of winners, with the codes of poker.who_wins
+    '''
+
+    get_strength = util.get_hand_strength
+
+    return(list(map(util.compare_strengths, map(get_strength, hands_1), 
+                    map(get_strength, hands_2))))
+
+
+def read_hand(value):
+    ''' Read a hand from a field of a file. As in poker.read_matchups, the
+    cards of the files may be in lower case.
+    input: the value of the field
+    return: the hand in upper case, or '' if the value is not a string
+    '''
+
+    return(value.upper() if isinstance(value, str) else '')
+
+
+def _count(summary, winners):
+    for winner in winners:
+        summary[winner] += 1
+
+
+def ingest_csv(in_file, out_file, columns=HAND_COLUMNS, 
+               result_column=RESULT_COLUMN, chunk_size=CHUNK_ROWS):
+    ''' Determine the winner of each row of a CSV file with a header, and 
+    write the rows with a column of winners.
+    input: the input and output files, the names of the two columns of 
+    hands, the name of the column of winners and the number of rows of a 
+    chunk
+    return: a dictionary of winner -> number of rows
+    '''
+
+    summary = dict.fromkeys(util.WINNER_MSG, 0)
+    reader = csv.reader(in_file)
+    writer = csv.writer(out_file, lineterminator='\n')
+
+    header = next(reader, None)
+    if header is None:
+        return(summary)
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError('The CSV file has no column {}'.format(
+            ', '.join(missing)))
+    index_1, index_2 = [header.index(column) for column in columns]
+    width = len(header)
+    writer.writerow(header + [result_column])
+
+    while True:
+        rows = list(itertools.islice(reader, chunk_size))
+        if not rows:
+            break
+
+        # a short row has no hands and fails
+        winners = evaluate_pairs(
+                [read_hand(row[index_1]) if len(row) > index_1 else '' 
+                 for row in rows],
+                [read_hand(row[index_2]) if len(row) > index_2 else '' 
+                 for row in rows])
+        # pad the short rows so that the winners stay in their column
+        writer.writerows([row + [''] * (width - len(row)) + [winner] 
+                          for row, winner in zip(rows, winners)])
+        _count(summary, winners)
+
+    out_file.flush()
+
+    return(summary)
+
+
+def ingest_jsonl(in_file, out_file, columns=HAND_COLUMNS, 
+                 result_column=RESULT_COLUMN, chunk_size=CHUNK_ROWS):
+    ''' Determine the winner of each object of a JSON Lines file, and write 
+    the objects with a field of winners. A line that is not a JSON object 
+    gets an object with the winner -1, an error message and the line itself 
+    under 'raw'. Blank lines are skipped.
+    input: the input and output files, the names of the two fields of hands, 
+    the name of the field of winners and the number of lines of a chunk
+    return: a dictionary of winner -> number of lines
+    '''
+
+    summary = dict.fromkeys(util.WINNER_MSG, 0)
+    column_1, column_2 = columns
+    loads = json.loads
+    dumps = json.dumps
+
+    while True:
+        lines = list(itertools.islice(in_file, chunk_size))
+        if not lines:
+            break
+
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                record = {'error': 'The line is not a JSON object', 
+                          'raw': line.rstrip('\r\n')}
+            records.append(record)
+
+        winners = evaluate_pairs(
+                [read_hand(record.get(column_1)) for record in records],
+                [read_hand(record.get(column_2)) for record in records])
+        for record, winner in zip(records, winners):
+            record[result_column] = winner
+        out_file.write(''.join([dumps(record) + '\n' for record in records]))
+        _count(summary, winners)
+
+    out_file.flush()
+
+    return(summary)
+
+
+def get_format(path):
+    ''' Guess the format of a file from its name: 'jsonl' for the .jsonl, 
+    .ndjson and .json files, 'csv' otherwise. 
+    '''
+
+    if path.lower().endswith(('.jsonl', '.ndjson', '.json')):
+        return('jsonl')
+
+    return('csv')
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    parser = argparse.ArgumentParser(description='Determine the winner of '
+                                     'each row of a CSV or JSON Lines file '
+                                     'and write the rows with their winner.')
+    parser.add_argument('input', help='the input file, - for stdin')
+    parser.add_argument('-o', '--output', default='-', 
+                        help='the output file, - for stdout (default)')
+    parser.add_argument('-f', '--format', choices=('csv', 'jsonl'), 
+                        help='the format of the files (default: guessed '
+                        'from the name of the input file)')
+    parser.add_argument('-c', '--columns', nargs=2, default=HAND_COLUMNS, 
+                        metavar=('HAND_1', 'HAND_2'), 
+                        help='the columns of the hands (default: hand_1 '
+                        'hand_2)')
+    parser.add_argument('-r', '--result-column', default=RESULT_COLUMN, 
+                        help='the column of the winners (default: winner)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_ROWS, 
+                        help='the number of rows read and written at once')
+    args = parser.parse_args()
+
+    ingest = {'csv': ingest_csv, 'jsonl': ingest_jsonl}[
+        args.format or get_format(args.input)]
+    in_file = (sys.stdin if args.input == '-' else 
+               open(args.input, newline='', buffering=FILE_BUFFER_BYTES))
+    out_file = (sys.stdout if args.output == '-' else 
+                open(args.output, 'w', newline='', 
+                     buffering=FILE_BUFFER_BYTES))
+    try:
+        summary = ingest(in_file, out_file, args.columns, 
+                         args.result_column, args.chunk_size)
+    finally:
+        for the_file in (in_file, out_file):
+            if the_file not in (sys.stdin, sys.stdout):
+                the_file.close()
+
+    for winner, count in summary.items():
+        print('{}\t{}'.format(util.WINNER_MSG[winner], count), 
+              file=sys.stderr)
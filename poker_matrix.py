@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A precomputed outcome matrix of the simplified poker game. The winner of 
+every pair of possible hands is stored in a file, 2 bits per pair, and read 
+from the memory-mapped file, so processes that open the same file share it 
+through the page cache of the operating system.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import mmap
+import struct
+import sys
+
+import lib_poker as util 
+
+
+# a file starts with the magic bytes, the format version and the number of
+# hands, followed by one row per hand in the order of their strength. Cell j
+# of row i holds who_wins(hand i, hand j) in bits 2 * (j % 4) of byte j // 4
+# of the row.
+MAGIC = b'PKRO'
+VERSION = 1
+HEADER = struct.Struct('<4sII')
+
+HANDS = util.POSSIBLE_HANDS
+ROW_SIZE = util.OUTCOME_ROW_SIZE
+
+# bytes of four cells where the first hand wins and where the second one wins
+FIRST_WINS_BYTE = 0b01010101
+SECOND_WINS_BYTE = 0b10101010
+
+
+def build_row(strength):
+    ''' Build the row of the outcome matrix of a hand. The hand wins against
+    every weaker hand, ties with itself and loses to every stronger hand.
+    input: the strength of the hand
+    return: the packed row as bytes
+    '''
+
+    bytes_before, position = divmod(strength, 4)
+    # the byte that holds the tie: first hand wins in the lower cells and 
+    # second hand wins in the higher ones
+    tie_byte = 0
+    for cell in range(4):
+        if cell < position:
+            tie_byte |= 1 << (2 * cell)
+        elif cell > position:
+            tie_byte |= 2 << (2 * cell)
+
+    return(bytes([FIRST_WINS_BYTE]) * bytes_before + bytes([tie_byte]) + 
+           bytes([SECOND_WINS_BYTE]) * (ROW_SIZE - bytes_before - 1))
+
+
+def build_outcome_matrix(path):
+    ''' Build the outcome matrix of all pairs of possible hands and save it.
+    input: the path of the file
+    return: the size of the file in bytes
+    '''
+
+    with open(path, 'wb') as the_file:
+        the_file.write(HEADER.pack(MAGIC, VERSION, HANDS))
+        for strength in range(HANDS):
+            the_file.write(build_row(strength))
+
+    return(HEADER.size + HANDS * ROW_SIZE)
+
+
+class OutcomeMatrix(object):
+    ''' A memory-mapped outcome matrix file. '''
+
+    def __init__(self, path):
+        with open(path, 'rb') as the_file:
+            self._mmap = mmap.mmap(the_file.fileno(), 0, 
+                                   access=mmap.ACCESS_READ)
+
+        # the size is checked first, so a short file does not get unpacked
+        if len(self._mmap) != HEADER.size + HANDS * ROW_SIZE or \
+                HEADER.unpack_from(self._mmap) != (MAGIC, VERSION, HANDS):
+            self._mmap.close()
+            raise ValueError('{} is not a version {} outcome matrix'.format(
+                path, VERSION))
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        ''' Release the memory-mapped file. '''
+
+        self._mmap.close()
+
+    def outcome(self, strength_1, strength_2):
+        ''' Read the winner of two hands given by their strengths.
+        return: the winner, with the codes of poker.who_wins, -1 for a 
+        strength out of the matrix
+        '''
+
+        if not (0 <= strength_1 < HANDS and 0 <= strength_2 < HANDS):
+            return(-1)
+
+        byte = self._mmap[HEADER.size + strength_1 * ROW_SIZE + 
+                          (strength_2 >> 2)]
+
+        return((byte >> ((strength_2 & 3) << 1)) & 3)
+
+    def who_wins(self, hand_1, hand_2):
+        ''' Determine the winner of the two poker hands from the matrix.
+        return: the winner, with the codes of poker.who_wins
+        '''
+
+        strength_1 = util.get_hand_strength(hand_1)
+        strength_2 = util.get_hand_strength(hand_2)
+        if strength_1 < 0 or strength_2 < 0:
+            return(-1)
+
+        return(self.outcome(strength_1, strength_2))
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    if len(sys.argv) == 3 and sys.argv[1] == 'build':
+        size = build_outcome_matrix(sys.argv[2])
+        print('Wrote {} bytes to {}'.format(size, sys.argv[2]))
+    elif len(sys.argv) == 4:
+        with OutcomeMatrix(sys.argv[1]) as matrix:
+            winner = matrix.who_wins(sys.argv[2].upper(), sys.argv[3].upper())
+        util.print_winner_message(winner)
+    else:
+        sys.exit('Usage: poker_matrix.py build {file} | '
+                 'poker_matrix.py {file} {hand_1} {hand_2}')
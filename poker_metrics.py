@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""Opt-in instrumentation of the simplified poker game. Once enabled, every 
+call of poker.who_wins is counted and timed by the combination types of the 
+hands and by the outcome, and the counters can be exported in the Prometheus
+text format or as JSON. While it is disabled, who_wins only checks that it is.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import json
+import threading
+import time
+
+import lib_poker as util 
+import poker
+
+
+# the upper bounds of the latency histogram buckets, in nanoseconds
+LATENCY_BUCKETS_NS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000)
+
+# who_wins compares the combination types first, and only compares the cards
+# of the hands when the types are the same
+PATHS = ('early_exit', 'tie_break', 'invalid')
+
+
+class Metrics(object):
+    ''' Counters and latency histograms of the calls of poker.who_wins. '''
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        ''' Set all counters to zero. '''
+
+        with self._lock:
+            # (type_1, type_2, winner) -> [calls, total nanoseconds]
+            self.calls = {}
+            self.paths = dict.fromkeys(PATHS, 0)
+            self.path_ns = dict.fromkeys(PATHS, 0)
+            # path -> count of each bucket, the last one is +Inf
+            self.histograms = {path: [0] * (len(LATENCY_BUCKETS_NS) + 1) 
+                               for path in PATHS}
+
+    def record(self, strength_1, strength_2, winner, elapsed_ns):
+        ''' Count one call of who_wins. 
+        input: the strengths of the hands, the winner and the time the call 
+        took in nanoseconds
+        '''
+
+        if winner == -1:
+            type_1 = type_2 = -1
+            path = 'invalid'
+        else:
+            type_1 = util.COMBINATION_TYPE_BY_STRENGTH[strength_1]
+            type_2 = util.COMBINATION_TYPE_BY_STRENGTH[strength_2]
+            path = 'tie_break' if type_1 == type_2 else 'early_exit'
+
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS_NS) and \
+                elapsed_ns > LATENCY_BUCKETS_NS[bucket]:
+            bucket += 1
+
+        key = (type_1, type_2, winner)
+        with self._lock:
+            call = self.calls.get(key)
+            if call is None:
+                call = self.calls[key] = [0, 0]
+            call[0] += 1
+            call[1] += elapsed_ns
+            self.paths[path] += 1
+            self.path_ns[path] += elapsed_ns
+            self.histograms[path][bucket] += 1
+
+    def to_dict(self):
+        ''' Export the counters as a dictionary that can be saved as JSON. '''
+
+        with self._lock:
+            return({'calls': [{'type_1': type_1, 'type_2': type_2, 
+                               'outcome': winner, 'count': count, 
+                               'total_ns': total_ns}
+                              for (type_1, type_2, winner), (count, total_ns)
+                              in sorted(self.calls.items())],
+                    'paths': dict(self.paths),
+                    'paths_total_ns': dict(self.path_ns),
+                    'latency_buckets_ns': list(LATENCY_BUCKETS_NS),
+                    'latency_histograms': {path: list(counts) for path, 
+                                           counts in self.histograms.items()}
+                   })
+
+    def to_json(self):
+        ''' Export the counters as a JSON string. '''
+
+        return(json.dumps(self.to_dict(), sort_keys=True))
+
+    def to_prometheus(self):
+        ''' Export the counters in the Prometheus text format. '''
+
+        data = self.to_dict()
+        lines = ['# HELP poker_who_wins_calls_total Calls of who_wins by '
+                 'combination types and outcome.',
+                 '# TYPE poker_who_wins_calls_total counter']
+        for call in data['calls']:
+            lines.append('poker_who_wins_calls_total{{type_1="{type_1}",'
+                         'type_2="{type_2}",outcome="{outcome}"}} '
+                         '{count}'.format(**call))
+
+        lines += ['# HELP poker_who_wins_seconds_total Time spent in '
+                  'who_wins by combination types and outcome.',
+                  '# TYPE poker_who_wins_seconds_total counter']
+        for call in data['calls']:
+            lines.append('poker_who_wins_seconds_total{{type_1="{type_1}",'
+                         'type_2="{type_2}",outcome="{outcome}"}} '
+                         '{seconds:.9f}'.format(seconds=call['total_ns'] / 1e9,
+                                                **call))
+
+        lines += ['# HELP poker_who_wins_latency_seconds Latency of who_wins '
+                  'by path.',
+                  '# TYPE poker_who_wins_latency_seconds histogram']
+        for path, counts in sorted(data['latency_histograms'].items()):
+            cumulative = 0
+            bounds = ['{:g}'.format(bound / 1e9) for bound in 
+                      LATENCY_BUCKETS_NS] + ['+Inf']
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append('poker_who_wins_latency_seconds_bucket{{'
+                             'path="{}",le="{}"}} {}'.format(path, bound, 
+                                                             cumulative))
+            lines.append('poker_who_wins_latency_seconds_sum{{path="{}"}} '
+                         '{:.9f}'.format(path, 
+                                         data['paths_total_ns'][path] / 1e9))
+            lines.append('poker_who_wins_latency_seconds_count{{path="{}"}} '
+                         '{}'.format(path, cumulative))
+
+        return('\n'.join(lines) + '\n')
+
+
+def enable():
+    ''' Start counting the calls of poker.who_wins.
+    return: the Metrics that count them
+    '''
+
+    if poker.metrics is None:
+        poker.metrics = Metrics()
+
+    return(poker.metrics)
+
+
+def disable():
+    ''' Stop counting the calls of poker.who_wins.
+    return: the Metrics that counted them, or None
+    '''
+
+    metrics = poker.metrics
+    poker.metrics = None
+
+    return(metrics)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A vectorized version of the simplified poker game for NumPy arrays of hands.
+It determines the winners of many pairs of hands at once, without a Python loop
+over the hands. It needs NumPy, which the rest of the game does not.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import numpy as np
+
+import lib_poker as util
+
+
+# the code of a card is its index in CARD_SET, 0 for '2' up to 12 for 'A'.
+# Any other character maps to INVALID_CODE.
+INVALID_CODE = 255
+
+CODE_BY_BYTE = np.full(256, INVALID_CODE, dtype=np.uint8)
+for code, card in enumerate(util.CARD_SET):
+    CODE_BY_BYTE[ord(card)] = code
+
+# the combination type of a hand indexed by its number of distinct cards and
+# the largest number of times a card is repeated, as in
+# util.COMBINATION_TYPE_BY_PATTERN. 0 marks an impossible hand.
+COMBINATION_TYPE_BY_SHAPE = np.zeros((6, 6), dtype=np.int64)
+for pattern, combination_type in util.COMBINATION_TYPE_BY_PATTERN.items():
+    COMBINATION_TYPE_BY_SHAPE[len(pattern), pattern[0]] = combination_type
+
+# place values to pack five card codes into one base 13 number
+PLACE_VALUES = 13 ** np.arange(4, -1, -1, dtype=np.int64)
+
+CHUNK_SIZE = 1 << 16
+
+
+def encode_hands(hands):
+    ''' Convert an array of 5-character hand strings to card codes.
+    input: an array-like of str or bytes hands
+    return: an (N, 5) uint8 array of card codes, where a hand that does not
+    contain exactly five characters gets only INVALID_CODE
+    '''
+
+    hands = np.asarray(hands)
+    if hands.dtype.kind not in 'US':
+        raise TypeError('hands must be an array of strings')
+    hands = hands.reshape(-1)
+
+    lengths = np.char.str_len(hands)
+    if hands.dtype.kind == 'U':
+        characters = hands.astype('U5').view(np.uint32).reshape(-1, 5)
+        characters = np.where(characters < 256, characters, 0)
+    else:
+        characters = hands.astype('S5').view(np.uint8).reshape(-1, 5)
+
+    codes = CODE_BY_BYTE[characters]
+    codes[lengths != 5] = INVALID_CODE
+
+    return(codes)
+
+
+def hand_keys(codes):
+    ''' Compute a comparable key of each hand, in the same order as
+    util.hand_key: the combination type first, then the card values
+    ordered by repetition and value.
+    input: an (N, 5) array of card codes
+    return: an int64 array of N keys, -1 for an impossible hand
+    '''
+
+    codes = np.asarray(codes)
+    if codes.ndim != 2 or codes.shape[1] != 5:
+        raise ValueError('codes must be an (N, 5) array')
+
+    valid = ((codes >= 0) & (codes < 13)).all(axis=1)
+    codes = np.where(valid[:, None], codes, 0).astype(np.int16)
+
+    # the number of times the value of each card appears in its hand
+    card_counts = (codes[:, :, None] == codes[:, None, :]).sum(axis=2,
+                                                              dtype=np.int16)
+
+    # order the cards by repetition and then by value, low to high
+    order = np.sort(card_counts * 16 + codes, axis=1)
+    packed = (order[:, ::-1] % 16).astype(np.int64) @ PLACE_VALUES
+
+    distinct = 1 + (np.diff(order, axis=1) != 0).sum(axis=1)
+    combination_type = COMBINATION_TYPE_BY_SHAPE[distinct, order[:, -1] // 16]
+    valid &= combination_type > 0
+
+    return(np.where(valid, combination_type * 13 ** 5 + packed, -1))
+
+
+def who_wins_codes(codes_1, codes_2):
+    ''' Determine the winners of pairs of hands given as card codes.
+    input: two (N, 5) arrays of card codes
+    return: an int8 array of N winners, with the codes of poker.who_wins
+        0: it is a tie
+        1: first hand wins
+        2: second hand wins
+        -1: fail
+    '''
+
+    codes_1 = np.asarray(codes_1)
+    codes_2 = np.asarray(codes_2)
+    if codes_1.shape != codes_2.shape:
+        raise ValueError('both arrays must contain the same number of hands')
+
+    winners = np.empty(len(codes_1), dtype=np.int8)
+    # evaluate in chunks to bound the size of the temporary arrays
+    for start in range(0, len(codes_1), CHUNK_SIZE):
+        end = start + CHUNK_SIZE
+        key_1 = hand_keys(codes_1[start:end])
+        key_2 = hand_keys(codes_2[start:end])
+
+        chunk = np.where(key_1 > key_2, 1, np.where(key_1 < key_2, 2, 0))
+        chunk[(key_1 < 0) | (key_2 < 0)] = -1
+        winners[start:end] = chunk
+
+    return(winners)
+
+
+def who_wins(hands_1, hands_2):
+    ''' Determine the winners of pairs of hands.
+    input: two arrays of hands, either (N, 5) uint8 arrays of card codes or
+    arrays of N 5-character strings
+    return: an int8 array of N winners, with the codes of poker.who_wins
+    '''
+
+    hands_1 = np.asarray(hands_1)
+    hands_2 = np.asarray(hands_2)
+    if hands_1.dtype.kind in 'US':
+        hands_1 = encode_hands(hands_1)
+    if hands_2.dtype.kind in 'US':
+        hands_2 = encode_hands(hands_2)
+
+    return(who_wins_codes(hands_1, hands_2))
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A parallel runner of the simplified poker game for large files of pairs of 
+hands. The file is split into shards at line boundaries and the shards are
+evaluated by a pool of worker processes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import argparse
+import array
+import multiprocessing
+import os
+import sys
+
+import lib_poker as util 
+import poker
+import poker_stats
+
+
+# the number of shards per worker, so that a slow shard does not leave the 
+# other workers idle at the end of a run
+SHARDS_PER_WORKER = 4
+
+
+def split_file(path, shards):
+    ''' Split a file into byte ranges that start and end at line boundaries.
+    input: the path of the file and the number of shards wanted
+    return: a list of (start, end) byte offsets, at most shards of them
+    '''
+
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as the_file:
+        for i in range(1, shards):
+            offset = max(size * i // shards, boundaries[-1])
+            if offset >= size:
+                break
+            # move to the start of the next line
+            the_file.seek(offset)
+            the_file.readline()
+            if the_file.tell() > boundaries[-1]:
+                boundaries.append(the_file.tell())
+
+    if boundaries[-1] < size:
+        boundaries.append(size)
+
+    return(list(zip(boundaries[:-1], boundaries[1:])))
+
+
+def iter_shard_hands(path, start, end):
+    ''' Read the pairs of hands in a shard of a file. 
+    input: the path of the file and the byte range of the shard
+    return: a generator of (hand_1, hand_2), where an illegal line gives a 
+    pair of empty hands
+    '''
+
+    with open(path, 'rb') as the_file:
+        the_file.seek(start)
+        position = start
+        for line in the_file:
+            if position >= end:
+                break
+            position += len(line)
+
+            hands = line.decode('ascii', 'replace').upper().split()
+            if len(hands) == 2:
+                yield(hands[0], hands[1])
+            else:
+                yield('', '')
+
+
+def iter_shard(path, start, end):
+    ''' Determine the winner of each pair of hands in a shard of a file. 
+    input: the path of the file and the byte range of the shard
+    return: a generator of the winners, with the codes of poker.who_wins, 
+    where an illegal line gets -1
+    '''
+
+    who_wins = poker.who_wins
+    for hand_1, hand_2 in iter_shard_hands(path, start, end):
+        yield(who_wins(hand_1, hand_2))
+
+
+def evaluate_shard(shard):
+    ''' Determine the winners in a shard of a file. 
+    input: a tuple of the path, the start and end of the shard 
+    return: an array of the winners of each line, in input order
+    '''
+
+    return(array.array('b', iter_shard(*shard)))
+
+
+def summarize_shard(shard):
+    ''' Count the winners in a shard of a file.
+    input: a tuple of the path, the start and end of the shard 
+    return: a dictionary of winner -> number of lines
+    '''
+
+    summary = dict.fromkeys(util.WINNER_MSG, 0)
+    for winner in iter_shard(*shard):
+        summary[winner] += 1
+
+    return(summary)
+
+
+def aggregate_shard(shard):
+    ''' Collect the statistics of the pairs of hands in a shard of a file.
+    input: a tuple of the path, the start and end of the shard 
+    return: the poker_stats.MatchupStats of the shard
+    '''
+
+    return(poker_stats.MatchupStats().update(iter_shard_hands(*shard)))
+
+
+def _run_shards(function, path, workers):
+    ''' Run a function over the shards of a file in a pool of processes.
+    return: a generator of the results of the shards, in input order
+    '''
+
+    workers = workers or os.cpu_count() or 1
+    shards = [(path, start, end) for start, end in 
+              split_file(path, workers * SHARDS_PER_WORKER)]
+
+    if workers == 1:
+        yield from map(function, shards)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(function, shards)
+
+
+def iter_file_winners(path, workers=None):
+    ''' Determine the winner of each line of a file in parallel.
+    input: the path of a file with one pair of hands per line and the number
+    of worker processes (all CPUs by default)
+    return: a generator of arrays of winners, one array per shard, in input 
+    order
+    '''
+
+    return(_run_shards(evaluate_shard, path, workers))
+
+
+def evaluate_file(path, workers=None):
+    ''' Determine the winner of each line of a file in parallel.
+    input: the path of a file with one pair of hands per line and the number
+    of worker processes (all CPUs by default)
+    return: an array of the winners of each line, in input order
+    '''
+
+    winners = array.array('b')
+    for shard_winners in iter_file_winners(path, workers):
+        winners.extend(shard_winners)
+
+    return(winners)
+
+
+def summarize_file(path, workers=None):
+    ''' Count the winners of the lines of a file in parallel.
+    input: the path of a file with one pair of hands per line and the number
+    of worker processes (all CPUs by default)
+    return: a dictionary of winner -> number of lines
+    '''
+
+    summary = dict.fromkeys(util.WINNER_MSG, 0)
+    for shard_summary in _run_shards(summarize_shard, path, workers):
+        for winner, count in shard_summary.items():
+            summary[winner] += count
+
+    return(summary)
+
+
+def aggregate_file(path, workers=None):
+    ''' Collect the statistics of the lines of a file in parallel.
+    input: the path of a file with one pair of hands per line and the number
+    of worker processes (all CPUs by default)
+    return: the poker_stats.MatchupStats of all the lines
+    '''
+
+    stats = poker_stats.MatchupStats()
+    for shard_stats in _run_shards(aggregate_shard, path, workers):
+        stats.merge(shard_stats)
+
+    return(stats)
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    parser = argparse.ArgumentParser(description='Determine the winner of '
+                                     'each pair of hands in a file, in '
+                                     'parallel.')
+    parser.add_argument('path', help='a file with one pair of hands per line')
+    parser.add_argument('-j', '--workers', type=int, default=None, 
+                        help='the number of worker processes (default: the '
+                        'number of CPUs)')
+    parser.add_argument('-s', '--summary', action='store_true', 
+                        help='print the number of lines of each result '
+                        'instead of one result per line')
+    parser.add_argument('--stats', action='store_true', 
+                        help='print the statistics of the pairs of hands as '
+                        'JSON instead of one result per line')
+    args = parser.parse_args()
+
+    if args.stats:
+        print(aggregate_file(args.path, args.workers).to_json())
+        sys.exit()
+
+    if args.summary:
+        summary = summarize_file(args.path, args.workers)
+        for winner, count in summary.items():
+            print('{}\t{}'.format(util.WINNER_MSG[winner], count))
+        sys.exit()
+
+    for shard_winners in iter_file_winners(args.path, args.workers):
+        sys.stdout.write(''.join(util.WINNER_MSG[winner] + '\n' 
+                                 for winner in shard_winners))
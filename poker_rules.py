@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""The rules of the simplified poker game that do not need the evaluation 
+tables: the cards, the combination types, the order of the hands, the 
+comparison of two strengths and the fingerprint of the tables built from these
+rules. The module imports no tables, so a process that only reads tables built
+elsewhere, such as a worker attached to the shared tables of poker_shared.py, 
+starts without building or loading them. lib_poker.py imports the same names.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import types
+import zlib
+
+
+CARD_SET = list('23456789TJQKA')
+
+CARD_VALUE = {'2':2, '3':3, '4':4, '5':5, '6':6, '7':7, '8':8, '9':9, 'T':10, 
+        'J':11, 'Q':12, 'K':13, 'A':14}
+
+# the combination type of a hand by how many times each card is repeated, 
+# as returned by check_card_combination_type.
+COMBINATION_TYPE_BY_PATTERN = {(1, 1, 1, 1, 1): 1,
+                               (2, 1, 1, 1): 2,
+                               (2, 2, 1): 3,
+                               (3, 1, 1): 4,
+                               (3, 2): 5,
+                               (4, 1): 6
+                              }
+
+# the version of the file format of the saved tables, see 
+# lib_poker.save_tables
+TABLES_VERSION = 2
+
+# the number of possible hands: multisets of 5 of the 13 card values, without
+# five cards of one value
+POSSIBLE_HANDS = 6175
+
+# the number of bytes of a row of the outcome matrix of poker_matrix.py, which
+# holds 2 bits per hand
+OUTCOME_ROW_SIZE = (POSSIBLE_HANDS + 3) // 4
+
+
+def get_rules_key(hand):
+    ''' Build the comparable key of a hand that orders the hands of the 
+    tables, see lib_poker.hand_key. 
+    input: a hand
+    return: a tuple of the combination type and the card values, or (-1,) if
+    it is not a possible card combination
+    '''
+
+    frequency = {}
+    for card in hand:
+        frequency[card] = frequency.get(card, 0) + 1
+
+    if not frequency.keys() <= CARD_VALUE.keys():
+        return((-1,))
+
+    groups = sorted([(count, CARD_VALUE[card]) 
+                     for card, count in frequency.items()], reverse=True)
+    combination_type = COMBINATION_TYPE_BY_PATTERN.get(
+            tuple([count for count, value in groups]), -1)
+    if combination_type == -1:
+        return((-1,))
+
+    return((combination_type,) + tuple([value for count, value in groups]))
+
+
+def _describe_code(code):
+    ''' Describe the bytecode, the constants and the names of a function, 
+    with those of the functions and comprehensions nested in it. 
+    '''
+
+    return((code.co_code, code.co_names, 
+            tuple([_describe_code(const) if isinstance(const, types.CodeType)
+                   else repr(const) for const in code.co_consts])))
+
+
+def get_tables_fingerprint():
+    ''' Get a fingerprint of the rules that the tables are built from, so 
+    that saved tables of other rules are detected as stale. The rules 
+    include the code of get_rules_key, which orders the hands, so a change of
+    the order changes the fingerprint too. The bytecode depends on the 
+    version of Python, so a new version of Python rebuilds the tables once.
+    '''
+
+    rules = repr((TABLES_VERSION, CARD_SET, 
+                  sorted(COMBINATION_TYPE_BY_PATTERN.items()), 
+                  _describe_code(get_rules_key.__code__)))
+
+    return(zlib.crc32(rules.encode('ascii')))
+
+
+def compare_strengths(strength_1, strength_2):
+    ''' Determine the winner of two hands given by their strengths. 
+    input: the strengths of the first and the second hand, -1 for a hand that
+    is not possible
+    return: the winner poker hand.
+        0: it is a tie
+        1: first hand wins 
+        2: second hand wins
+        -1: fail
+    '''
+
+    if strength_1 < 0 or strength_2 < 0:
+        return(-1)
+    elif strength_1 > strength_2:
+        return(1)
+    elif strength_1 < strength_2:
+        return(2)
+
+    return(0)
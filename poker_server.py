@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A network service of the simplified poker game. Clients send one request per
+line over TCP and get one response line per request, in order. The requests 
+of all connections that are waiting are evaluated together in batches, and a 
+lone request is evaluated at once.
+
+Requests:
+    WINS {hand_1} {hand_2}        the winner, with the codes of who_wins
+    TYPE {hand}                   the combination type of a hand
+    SHOWDOWN {hand_1} {hand_2} .. the indices of the winning hands
+Responses are "OK {result}" or "ERR {message}".
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import argparse
+import asyncio
+
+import lib_poker as util 
+import poker
+
+
+MAX_BATCH = 256
+# how many requests of one connection may wait for their responses before 
+# the server stops reading from it
+MAX_PIPELINE = 1024
+
+
+def handle_request(line):
+    ''' Evaluate one request line.
+    input: the request line, without the line break
+    return: the response line, without the line break
+    '''
+
+    words = line.upper().split()
+    if not words:
+        return('ERR Empty request')
+
+    command, hands = words[0], words[1:]
+    if command == 'WINS':
+        if len(hands) != 2:
+            return('ERR WINS needs two hands')
+        error = poker.check_hands(*hands)
+        if error:
+            return('ERR ' + error)
+        return('OK {}'.format(poker.who_wins(*hands)))
+
+    if command == 'TYPE':
+        if len(hands) != 1:
+            return('ERR TYPE needs one hand')
+        strength = util.get_hand_strength(hands[0])
+        if strength < 0:
+            return('ERR Not a legal hand')
+        return('OK {}'.format(util.COMBINATION_TYPE_BY_STRENGTH[strength]))
+
+    if command == 'SHOWDOWN':
+        if not hands:
+            return('ERR SHOWDOWN needs at least one hand')
+        try:
+            winners = poker.showdown(hands)
+        except ValueError as error:
+            return('ERR {}'.format(error))
+        return('OK ' + ' '.join(str(index) for index in winners))
+
+    return('ERR Unknown command {}'.format(command))
+
+
+def handle_batch(lines):
+    ''' Evaluate a batch of request lines. A request that is repeated in the
+    batch is evaluated once.
+    input: the request lines
+    return: a list of the response lines, in request order
+    '''
+
+    responses = {line: handle_request(line) for line in dict.fromkeys(lines)}
+
+    return([responses[line] for line in lines])
+
+
+class PokerServer(object):
+    ''' A TCP server that evaluates the requests of its connections in
+    batches. 
+
+    Each request is queued with a future. A batch task takes the requests
+    that are already queued, up to max_batch of them, evaluates them in one 
+    go and sets their futures. It never waits for more requests, so a lone 
+    request is answered at once. Every connection writes the responses in 
+    request order.
+    '''
+
+    def __init__(self, host='127.0.0.1', port=0, max_batch=MAX_BATCH, 
+                 max_pipeline=MAX_PIPELINE):
+        self.host = host
+        self.port = port
+        self.max_batch = max_batch
+        self.max_pipeline = max_pipeline
+
+        self.batches = 0
+        self.requests = 0
+
+        self._server = None
+        self._batch_task = None
+        self._queue = None
+        self._connections = {}
+
+    async def start(self):
+        ''' Start listening. The port is set when it is chosen by the 
+        system. 
+        '''
+
+        self._queue = asyncio.Queue()
+        self._batch_task = asyncio.create_task(self._run_batches())
+        self._server = await asyncio.start_server(self._handle_connection, 
+                                                  self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        ''' Stop listening, close the connections and stop evaluating 
+        requests. 
+        '''
+
+        self._server.close()
+        # a closed connection ends its handler once its pending responses 
+        # are evaluated, so the batch task stops last
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+
+        self._batch_task.cancel()
+        try:
+            await self._batch_task
+        except asyncio.CancelledError:
+            pass
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _run_batches(self):
+        ''' Take the queued requests and evaluate them in batches. '''
+
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            responses = handle_batch([line for line, future in batch])
+            for (line, future), response in zip(batch, responses):
+                if not future.cancelled():
+                    future.set_result(response)
+            self.batches += 1
+            self.requests += len(batch)
+
+    async def _handle_connection(self, reader, writer):
+        ''' Queue the requests of a connection and write their responses. '''
+
+        connection = asyncio.current_task()
+        self._connections[connection] = writer
+
+        loop = asyncio.get_running_loop()
+        # the bounded queue of pending responses stops the reading when a
+        # client sends faster than it reads its responses
+        pending = asyncio.Queue(self.max_pipeline)
+        write_task = asyncio.create_task(self._write_responses(pending, 
+                                                               writer))
+        try:
+            try:
+                async for line in reader:
+                    future = loop.create_future()
+                    await pending.put(future)
+                    self._queue.put_nowait((line.decode('ascii', 'replace'), 
+                                            future))
+            except ValueError:
+                # a line over the limit of the reader
+                pass
+            await pending.put(None)
+            await write_task
+        except ConnectionError:
+            pass
+        finally:
+            write_task.cancel()
+            writer.close()
+            del self._connections[connection]
+
+    @staticmethod
+    async def _write_responses(pending, writer):
+        ''' Write the responses of a connection in request order. '''
+
+        while True:
+            future = await pending.get()
+            if future is None:
+                break
+            response = await future
+            # the responses of a closed connection are dropped
+            if writer.is_closing():
+                continue
+            writer.write((response + '\n').encode('ascii', 'replace'))
+            if pending.empty():
+                await writer.drain()
+
+        if not writer.is_closing():
+            await writer.drain()
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    parser = argparse.ArgumentParser(description='Serve the poker game over '
+                                     'TCP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('-p', '--port', type=int, default=7777)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(PokerServer(args.host, args.port).serve_forever())
+    except KeyboardInterrupt:
+        pass
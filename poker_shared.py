@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""Evaluation tables of the simplified poker game published once in shared 
+memory, so that worker processes attach to them without a copy of their own 
+and read them without locks. The tables hold the strength of every hand by its
+index among the multisets of 5 cards and, optionally, the outcome matrix of 
+poker_matrix.py.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import array
+import math
+import struct
+import sys
+from multiprocessing import shared_memory
+
+import poker_rules as rules
+
+
+# the index of a hand is the colex rank of its card indices, sorted and made 
+# strictly increasing by adding their positions: sum(comb(code + i, i + 1)) 
+# over the sorted codes. It ranges over all multisets of 5 of the 13 values,
+# including the impossible five of a kind.
+INDEX_SIZE = math.comb(len(rules.CARD_SET) + 4, 5)
+COLEX = [[math.comb(code + position, position + 1) 
+          for code in range(len(rules.CARD_SET))] for position in range(5)]
+CARD_CODE = {card: code for code, card in enumerate(rules.CARD_SET)}
+
+INVALID_STRENGTH = 0xFFFF
+
+# the shared memory starts with the magic bytes, the format version, the 
+# fingerprint of the rules, the number of strengths and the number of rows of
+# the outcome matrix, 0 if it is left out. The strengths follow as unsigned 
+# 16 bit integers, then the rows of the outcome matrix.
+MAGIC = b'PKSH'
+VERSION = 1
+HEADER = struct.Struct('<4sIIII')
+
+# the tables attached by init_worker in a worker process
+tables = None
+
+
+def get_index(hand):
+    ''' Get the index of a hand among the multisets of 5 cards.
+    input: a hand
+    return: the index, or -1 if the hand does not contain 5 cards
+    '''
+
+    if len(hand) != 5:
+        return(-1)
+    try:
+        a, b, c, d, e = sorted(map(CARD_CODE.__getitem__, hand))
+    except KeyError:
+        return(-1)
+
+    return(COLEX[0][a] + COLEX[1][b] + COLEX[2][c] + COLEX[3][d] + COLEX[4][e])
+
+
+def build_strengths():
+    ''' Build the strength of every hand by its index.
+    return: a list of INDEX_SIZE strengths, INVALID_STRENGTH for the 
+    impossible hands
+    '''
+
+    # only the process that creates the tables needs those of lib_poker
+    import lib_poker as util
+
+    strengths = [INVALID_STRENGTH] * INDEX_SIZE
+    for strength, hand in enumerate(util.HANDS_BY_STRENGTH):
+        strengths[get_index(hand)] = strength
+
+    return(strengths)
+
+
+class SharedTables(object):
+    ''' The evaluation tables in a block of shared memory. The process that 
+    creates them owns the block and unlinks it, the others attach to it by
+    name. 
+    '''
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.owner = owner
+
+        magic, version, fingerprint, size, rows = HEADER.unpack_from(shm.buf)
+        if magic != MAGIC or version != VERSION or \
+                fingerprint != rules.get_tables_fingerprint() or \
+                size != INDEX_SIZE or rows not in (0, rules.POSSIBLE_HANDS):
+            shm.close()
+            raise ValueError('{} does not hold version {} tables'.format(
+                shm.name, VERSION))
+
+        matrix_start = HEADER.size + 2 * INDEX_SIZE
+        self._views = [shm.buf[HEADER.size:matrix_start]]
+        self._strengths = self._views[0].cast('H')
+        self._views.append(self._strengths)
+        self._matrix = None
+        if rows:
+            self._matrix = shm.buf[matrix_start:matrix_start + 
+                                   rows * rules.OUTCOME_ROW_SIZE]
+            self._views.append(self._matrix)
+
+    @classmethod
+    def create(cls, name=None, matrix=False):
+        ''' Build the tables into a new block of shared memory.
+        input: the name of the block, a unique one by default, and whether to
+        include the outcome matrix, about 10 MB
+        return: the owning SharedTables
+        '''
+
+        # the rows of the outcome matrix are built by the creator only
+        import poker_matrix
+
+        rows = rules.POSSIBLE_HANDS if matrix else 0
+        matrix_start = HEADER.size + 2 * INDEX_SIZE
+        shm = shared_memory.SharedMemory(
+                name, create=True, 
+                size=matrix_start + rows * rules.OUTCOME_ROW_SIZE)
+
+        try:
+            HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, 
+                             rules.get_tables_fingerprint(), INDEX_SIZE, rows)
+            with shm.buf[HEADER.size:matrix_start].cast('H') as strengths:
+                strengths[:] = array.array('H', build_strengths())
+            for strength in range(rows):
+                start = matrix_start + strength * rules.OUTCOME_ROW_SIZE
+                shm.buf[start:start + rules.OUTCOME_ROW_SIZE] = \
+                    poker_matrix.build_row(strength)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        return(cls(shm, owner=True))
+
+    @classmethod
+    def attach(cls, name):
+        ''' Attach to the tables that another process created.
+        input: the name of the block
+        return: a SharedTables that does not own the block
+        '''
+
+        # attaching from a process that shares the resource tracker of the 
+        # creator, such as a worker of a pool, is safe before Python 3.13. 
+        # Otherwise the tracker of the process would unlink the block when 
+        # the process exits. 
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name)
+
+        return(cls(shm, owner=False))
+
+    @property
+    def name(self):
+        ''' The name to attach to the tables. '''
+
+        return(self._shm.name)
+
+    @property
+    def has_matrix(self):
+        ''' Whether the tables include the outcome matrix. '''
+
+        return(self._matrix is not None)
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def close(self):
+        ''' Detach from the shared memory. The tables can not be read after. 
+        '''
+
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._shm.close()
+
+    def unlink(self):
+        ''' Free the shared memory once every process has closed it. '''
+
+        self._shm.unlink()
+
+    def strength(self, hand):
+        ''' Look up the strength of a hand.
+        return: the strength, or -1 if it is not a possible hand
+        '''
+
+        index = get_index(hand)
+        if index < 0:
+            return(-1)
+        strength = self._strengths[index]
+
+        return(-1 if strength == INVALID_STRENGTH else strength)
+
+    def outcome(self, strength_1, strength_2):
+        ''' Read the winner of two hands given by their strengths from the 
+        outcome matrix.
+        return: the winner, with the codes of poker.who_wins, -1 for a 
+        strength out of the matrix
+        '''
+
+        if not (0 <= strength_1 < rules.POSSIBLE_HANDS and 
+                0 <= strength_2 < rules.POSSIBLE_HANDS):
+            return(-1)
+
+        byte = self._matrix[strength_1 * rules.OUTCOME_ROW_SIZE + 
+                            (strength_2 >> 2)]
+
+        return((byte >> ((strength_2 & 3) << 1)) & 3)
+
+    def who_wins(self, hand_1, hand_2):
+        ''' Determine the winner of the two poker hands from the tables.
+        return: the winner, with the codes of poker.who_wins
+        '''
+
+        strength_1 = self.strength(hand_1)
+        strength_2 = self.strength(hand_2)
+        if strength_1 < 0 or strength_2 < 0:
+            return(-1)
+        if self._matrix is not None:
+            return(self.outcome(strength_1, strength_2))
+
+        return(rules.compare_strengths(strength_1, strength_2))
+
+
+def init_worker(name):
+    ''' Attach a worker process to the shared tables, as the initializer of a 
+    multiprocessing pool.
+    input: the name of the tables
+    '''
+
+    global tables
+    tables = SharedTables.attach(name)
+
+
+def evaluate_pairs(pairs):
+    ''' Determine the winners of pairs of hands in a worker process, with the
+    tables attached by init_worker.
+    input: a list of (hand_1, hand_2)
+    return: the list of winners, with the codes of poker.who_wins
+    '''
+
+    return([tables.who_wins(hand_1, hand_2) for hand_1, hand_2 in pairs])
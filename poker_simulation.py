@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A Monte Carlo simulation of the simplified poker game. Pairs of hands are 
+dealt from a deck with 4 cards of each value, in batches that each have their 
+own seeded random generator, so a simulation gives the same results for the 
+same seed whatever the number of worker processes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import argparse
+import collections
+import math
+import multiprocessing
+import random
+
+import lib_poker as util 
+
+
+DECK = [card for card in util.CARD_SET for _ in range(4)]
+
+COMBINATION_TYPE_NAMES = {1: 'high cards',
+                          2: 'pair',
+                          3: 'two pairs',
+                          4: 'triples',
+                          5: 'full house',
+                          6: 'four of a kind'
+                         }
+
+BATCH_SIZE = 10000
+
+# the normal quantile of a 95% confidence interval
+Z_95 = 1.959963984540054
+
+SimulationResult = collections.namedtuple('SimulationResult', 
+                                          ['deals', 'hands_by_type', 
+                                           'outcomes'])
+
+
+def get_batch_random(seed, batch):
+    ''' Get the random generator of a batch of deals. It only depends on the
+    seed and the batch number, not on the process that deals the batch. 
+    '''
+
+    return(random.Random('{}:{}'.format(seed, batch)))
+
+
+def simulate_batch(seed, batch, deals):
+    ''' Deal and score pairs of hands. 
+    input: the seed of the simulation, the batch number and the number of 
+    pairs of hands to deal
+    return: a SimulationResult of the batch
+    '''
+
+    rng = get_batch_random(seed, batch)
+    sample = rng.sample
+    strength_table = util.STRENGTH_TABLE
+    type_by_strength = util.COMBINATION_TYPE_BY_STRENGTH
+    compare_strengths = util.compare_strengths
+
+    hands_by_type = dict.fromkeys(COMBINATION_TYPE_NAMES, 0)
+    outcomes = {0: 0, 1: 0, 2: 0}
+    for _ in range(deals):
+        cards = sample(DECK, 10)
+        strength_1 = strength_table[''.join(sorted(cards[:5]))]
+        strength_2 = strength_table[''.join(sorted(cards[5:]))]
+
+        hands_by_type[type_by_strength[strength_1]] += 1
+        hands_by_type[type_by_strength[strength_2]] += 1
+        outcomes[compare_strengths(strength_1, strength_2)] += 1
+
+    return(SimulationResult(deals, hands_by_type, outcomes))
+
+
+def _simulate_batch(args):
+    return(simulate_batch(*args))
+
+
+def merge_results(results):
+    ''' Add up the results of several batches. '''
+
+    deals = 0
+    hands_by_type = dict.fromkeys(COMBINATION_TYPE_NAMES, 0)
+    outcomes = {0: 0, 1: 0, 2: 0}
+    for result in results:
+        deals += result.deals
+        for combination_type, count in result.hands_by_type.items():
+            hands_by_type[combination_type] += count
+        for winner, count in result.outcomes.items():
+            outcomes[winner] += count
+
+    return(SimulationResult(deals, hands_by_type, outcomes))
+
+
+def simulate(deals, seed=0, workers=1, batch_size=BATCH_SIZE):
+    ''' Deal and score pairs of hands in batches. 
+    input: the number of pairs of hands to deal, the seed, the number of 
+    worker processes and the number of pairs of hands in a batch
+    return: a SimulationResult with the number of deals, the number of hands
+    of each combination type and the number of ties (0), first hand wins (1)
+    and second hand wins (2)
+    '''
+
+    tasks = [(seed, batch, min(batch_size, deals - start)) 
+             for batch, start in enumerate(range(0, deals, batch_size))]
+
+    if workers == 1:
+        return(merge_results(map(_simulate_batch, tasks)))
+
+    with multiprocessing.Pool(workers) as pool:
+        return(merge_results(pool.imap_unordered(_simulate_batch, tasks)))
+
+
+def confidence_interval(successes, trials, z=Z_95):
+    ''' Compute the Wilson score interval of a proportion. 
+    input: the number of successes and trials, and the normal quantile of the
+    confidence level (95% by default)
+    return: the (low, high) bounds of the proportion
+    '''
+
+    if trials == 0:
+        return((0.0, 1.0))
+
+    proportion = successes / trials
+    denominator = 1 + z * z / trials
+    center = (proportion + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(proportion * (1 - proportion) / trials + 
+                           z * z / (4 * trials * trials)) / denominator
+
+    low = 0.0 if successes == 0 else max(0.0, center - margin)
+    high = 1.0 if successes == trials else min(1.0, center + margin)
+
+    return((low, high))
+
+
+def report(result):
+    ''' Summarize a simulation as rates with their 95% confidence intervals.
+    return: a dictionary with the 'deals', the 'combination_types' and the 
+    'outcomes', where every rate is a (rate, low, high) tuple
+    '''
+
+    def rate(count, total):
+        return((count / total if total else 0.0,) + 
+               confidence_interval(count, total))
+
+    hands = 2 * result.deals
+    return({'deals': result.deals,
+            'combination_types': {
+                COMBINATION_TYPE_NAMES[combination_type]: rate(count, hands) 
+                for combination_type, count in result.hands_by_type.items()},
+            'outcomes': {
+                util.WINNER_MSG[winner]: rate(count, result.deals) 
+                for winner, count in result.outcomes.items()}
+           })
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    parser = argparse.ArgumentParser(description='Simulate random pairs of '
+                                     'hands.')
+    parser.add_argument('-n', '--deals', type=int, default=1000000, 
+                        help='the number of pairs of hands to deal')
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-j', '--workers', type=int, default=1, 
+                        help='the number of worker processes')
+    args = parser.parse_args()
+
+    summary = report(simulate(args.deals, args.seed, args.workers))
+
+    print('Deals: {}'.format(summary['deals']))
+    for section in ('combination_types', 'outcomes'):
+        for name, (value, low, high) in summary[section].items():
+            print('{:<20} {:.6f} [{:.6f}, {:.6f}]'.format(name, value, low, 
+                                                          high))
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""Running statistics of the matchups of the simplified poker game. They consume 
+any number of pairs of hands in constant memory, and the statistics of 
+separate shards of the matchups merge into the statistics of all of them. 
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import json
+
+import lib_poker as util 
+
+
+# the combination types of check_card_combination_type, from 1 to 6
+COMBINATION_TYPES = 6
+
+
+class MatchupStats(object):
+    ''' Counters of the outcomes of pairs of hands, by combination types and
+    by hand. 
+    '''
+
+    def __init__(self):
+        # winner -> number of pairs, with the codes of poker.who_wins
+        self.outcomes = dict.fromkeys(util.WINNER_MSG, 0)
+        # type_matrix[type_1 - 1][type_2 - 1][winner] is the number of pairs
+        # of these combination types won by the winner, 0 for a tie
+        self.type_matrix = [[[0, 0, 0] for type_2 in range(COMBINATION_TYPES)]
+                            for type_1 in range(COMBINATION_TYPES)]
+        # the number of times each hand was played and won, by strength
+        self.hand_counts = [0] * len(util.HANDS_BY_STRENGTH)
+        self.hand_wins = [0] * len(util.HANDS_BY_STRENGTH)
+
+    def add(self, hand_1, hand_2):
+        ''' Count one pair of hands.
+        return: the winner, with the codes of poker.who_wins
+        '''
+
+        return(self.add_strengths(util.get_hand_strength(hand_1), 
+                                  util.get_hand_strength(hand_2)))
+
+    def add_strengths(self, strength_1, strength_2):
+        ''' Count one pair of hands given by their strengths, -1 for an 
+        illegal hand.
+        return: the winner, with the codes of poker.who_wins
+        '''
+
+        winner = util.compare_strengths(strength_1, strength_2)
+        if winner < 0:
+            self.outcomes[-1] += 1
+            return(-1)
+
+        if winner == 1:
+            self.hand_wins[strength_1] += 1
+        elif winner == 2:
+            self.hand_wins[strength_2] += 1
+
+        self.outcomes[winner] += 1
+        self.type_matrix[util.COMBINATION_TYPE_BY_STRENGTH[strength_1] - 1][
+            util.COMBINATION_TYPE_BY_STRENGTH[strength_2] - 1][winner] += 1
+        self.hand_counts[strength_1] += 1
+        self.hand_counts[strength_2] += 1
+
+        return(winner)
+
+    def update(self, matchups):
+        ''' Count pairs of hands, one at a time.
+        input: an iterable of (hand_1, hand_2), such as a generator
+        return: the statistics themselves
+        '''
+
+        get_hand_strength = util.get_hand_strength
+        add_strengths = self.add_strengths
+        for hand_1, hand_2 in matchups:
+            add_strengths(get_hand_strength(hand_1), get_hand_strength(hand_2))
+
+        return(self)
+
+    def merge(self, other):
+        ''' Add the counters of other statistics, such as those of another 
+        shard of the matchups.
+        return: the statistics themselves
+        '''
+
+        for winner, count in other.outcomes.items():
+            self.outcomes[winner] += count
+        for row, other_row in zip(self.type_matrix, other.type_matrix):
+            for cell, other_cell in zip(row, other_row):
+                for winner, count in enumerate(other_cell):
+                    cell[winner] += count
+        self.hand_counts = [count + other_count for count, other_count in 
+                            zip(self.hand_counts, other.hand_counts)]
+        self.hand_wins = [count + other_count for count, other_count in 
+                          zip(self.hand_wins, other.hand_wins)]
+
+        return(self)
+
+    def __iadd__(self, other):
+        return(self.merge(other))
+
+    @property
+    def total(self):
+        ''' The number of pairs, including the illegal ones. '''
+
+        return(sum(self.outcomes.values()))
+
+    @property
+    def tie_rate(self):
+        ''' The rate of ties among the legal pairs. '''
+
+        legal = self.total - self.outcomes[-1]
+
+        return(self.outcomes[0] / legal if legal else 0.0)
+
+    def to_dict(self):
+        ''' Export the statistics as a dictionary that can be saved as JSON.
+        The hands that were never played are left out. 
+        '''
+
+        return({'outcomes': {str(winner): count for winner, count in 
+                             self.outcomes.items()},
+                'tie_rate': self.tie_rate,
+                'type_matrix': [[list(cell) for cell in row] 
+                                for row in self.type_matrix],
+                'hands': {util.HANDS_BY_STRENGTH[strength]: 
+                          {'count': count, 'wins': self.hand_wins[strength]}
+                          for strength, count in enumerate(self.hand_counts)
+                          if count}})
+
+    def to_json(self):
+        ''' Export the statistics as a JSON string. '''
+
+        return(json.dumps(self.to_dict(), sort_keys=True))
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""An optional evaluator of real poker hands of 5 cards with suits, such as 
+'AsKdQhJcTs'. Unlike the rest of the game it ranks flushes, straights and 
+straight flushes, in nine categories. A hand is evaluated with three lookup 
+tables: one for flushes indexed by the bits of the card values, one for the
+other hands of five different values and one for the hands with repeated 
+values, indexed by the product of a prime number per card value. 
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import sys
+
+import lib_poker as util 
+
+
+SUITS = 'cdhs'
+
+CATEGORY_NAMES = {1: 'high card',
+                  2: 'pair',
+                  3: 'two pairs',
+                  4: 'triples',
+                  5: 'straight',
+                  6: 'flush',
+                  7: 'full house',
+                  8: 'four of a kind',
+                  9: 'straight flush'
+                 }
+
+# the category of each combination type of check_card_combination_type
+CATEGORY_BY_COMBINATION_TYPE = {1: 1, 2: 2, 3: 3, 4: 4, 5: 7, 6: 8}
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# the code of a card holds the bit of its value from bit 16, the bit of its 
+# suit from bit 12, the index of its value from bit 8 and the prime of its 
+# value in the low 8 bits
+CARD_CODE = {}
+for _index, _card in enumerate(util.CARD_SET):
+    for _suit_index, _suit in enumerate(SUITS):
+        CARD_CODE[_card + _suit] = ((1 << (16 + _index)) | 
+                                    (1 << (12 + _suit_index)) | 
+                                    (_index << 8) | PRIMES[_index])
+del _index, _card, _suit_index, _suit
+
+
+def get_straight_value(values):
+    ''' Get the value of the highest card of a straight.
+    input: five different card values, high to low
+    return: the value of the highest card, 5 for A2345, or 0 if the values 
+    are not a straight
+    '''
+
+    if values[0] - values[4] == 4:
+        return(values[0])
+    if values == [14, 5, 4, 3, 2]:
+        return(5)
+
+    return(0)
+
+
+def build_tables():
+    ''' Rank every hand and build the lookup tables. 
+    return: (flush table, table of five values, table by prime product, 
+    category by strength), where the strength of a hand is its rank among 
+    all hands, 0 for the weakest
+    '''
+
+    # (category, card values) -> (table, index) of every distinct hand
+    keys = {}
+    for hand in util.HANDS_BY_STRENGTH:
+        key = util.hand_key(hand)
+        values = list(key[1:])
+        bits = sum(1 << util.CARD_SET.index(card) for card in hand)
+        if key[0] == 1:
+            straight = get_straight_value(values)
+            if straight:
+                keys[(5, straight)] = ('unique', bits)
+                keys[(9, straight)] = ('flush', bits)
+            else:
+                keys[(1,) + key[1:]] = ('unique', bits)
+                keys[(6,) + key[1:]] = ('flush', bits)
+        else:
+            product = 1
+            for card in hand:
+                product *= PRIMES[util.CARD_SET.index(card)]
+            keys[(CATEGORY_BY_COMBINATION_TYPE[key[0]],) + key[1:]] = \
+                ('product', product)
+
+    tables = {'flush': [-1] * (1 << len(util.CARD_SET)), 
+              'unique': [-1] * (1 << len(util.CARD_SET)), 
+              'product': {}}
+    categories = []
+    for strength, key in enumerate(sorted(keys)):
+        table, index = keys[key]
+        tables[table][index] = strength
+        categories.append(key[0])
+
+    return(tables['flush'], tables['unique'], tables['product'], categories)
+
+
+FLUSH_TABLE, UNIQUE_TABLE, PRODUCT_TABLE, CATEGORY_BY_STRENGTH = \
+    build_tables()
+
+
+def parse_hand(hand):
+    ''' Convert a hand of 5 suited cards to card codes.
+    input: a string such as 'AsKdQhJcTs', spaces are ignored
+    return: a tuple of 5 card codes
+    '''
+
+    cards = hand.replace(' ', '')
+    if len(cards) != 10:
+        raise ValueError('{!r} does not contain 5 cards'.format(hand))
+    try:
+        codes = tuple([CARD_CODE[cards[start:start + 2]] 
+                       for start in range(0, 10, 2)])
+    except KeyError as error:
+        raise ValueError('{!r} is not a card'.format(error.args[0]))
+    if len(set(codes)) != 5:
+        raise ValueError('{!r} contains a card twice'.format(hand))
+
+    return(codes)
+
+
+def evaluate(c1, c2, c3, c4, c5):
+    ''' Look up the strength of a hand given by its card codes.
+    return: the strength, from 0 for the weakest hand
+    '''
+
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return(FLUSH_TABLE[(c1 | c2 | c3 | c4 | c5) >> 16])
+
+    strength = UNIQUE_TABLE[(c1 | c2 | c3 | c4 | c5) >> 16]
+    if strength >= 0:
+        return(strength)
+
+    return(PRODUCT_TABLE[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * 
+                         (c4 & 0xFF) * (c5 & 0xFF)])
+
+
+def evaluate_hands(hands):
+    ''' Look up the strengths of many hands given by their card codes.
+    input: an iterable of 5-tuples of card codes, as given by parse_hand
+    return: a list of strengths
+    '''
+
+    flush_table = FLUSH_TABLE
+    unique_table = UNIQUE_TABLE
+    product_table = PRODUCT_TABLE
+
+    strengths = []
+    append = strengths.append
+    for c1, c2, c3, c4, c5 in hands:
+        bits = (c1 | c2 | c3 | c4 | c5) >> 16
+        if c1 & c2 & c3 & c4 & c5 & 0xF000:
+            append(flush_table[bits])
+        elif unique_table[bits] >= 0:
+            append(unique_table[bits])
+        else:
+            append(product_table[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * 
+                                 (c4 & 0xFF) * (c5 & 0xFF)])
+
+    return(strengths)
+
+
+def get_hand_strength(hand):
+    ''' Look up the strength of a hand of 5 suited cards.
+    return: the strength, or -1 if it is not a possible hand
+    '''
+
+    try:
+        return(evaluate(*parse_hand(hand)))
+    except ValueError:
+        return(-1)
+
+
+def get_category(hand):
+    ''' Get the name of the category of a hand of 5 suited cards, such as 
+    'flush'.
+    '''
+
+    return(CATEGORY_NAMES[CATEGORY_BY_STRENGTH[evaluate(*parse_hand(hand))]])
+
+
+def who_wins(hand_1, hand_2):
+    ''' Determine the winner of two hands of 5 suited cards.
+    return: the winner, with the codes of poker.who_wins. Hands that share a
+    card fail. 
+    '''
+
+    try:
+        codes_1 = parse_hand(hand_1)
+        codes_2 = parse_hand(hand_2)
+    except ValueError:
+        return(-1)
+    if set(codes_1) & set(codes_2):
+        return(-1)
+
+    return(util.compare_strengths(evaluate(*codes_1), evaluate(*codes_2)))
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    if len(sys.argv) != 3:
+        sys.exit('Usage: poker_suited.py {hand_1} {hand_2}')
+
+    util.print_winner_message(who_wins(sys.argv[1], sys.argv[2]))
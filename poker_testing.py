@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""Shared set up for the tests of the poker game. The tests save tables,
+so they keep them in a temporary cache directory instead of the cache of
+the user. Call use_cache_directory before importing lib_poker.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import tempfile
+
+CACHE_DIRECTORY = None
+
+
+def use_cache_directory():
+    ''' Point POKER_CACHE_DIR at a temporary directory that all the test 
+    modules share. It has to be called before lib_poker is imported, 
+    because lib_poker loads its tables at import.
+    return: the path of the directory
+    '''
+
+    global CACHE_DIRECTORY
+
+    if CACHE_DIRECTORY is None:
+        CACHE_DIRECTORY = tempfile.TemporaryDirectory()
+    os.environ['POKER_CACHE_DIR'] = CACHE_DIRECTORY.name
+
+    return(CACHE_DIRECTORY.name)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A simulator of knockout tournaments of the simplified poker game. Each round
+seats the remaining players at tables, deals a hand to every player and 
+advances the winners of each table, until one player is left. The tables of a
+round are played in a pool of processes, each with a random generator derived
+from the seed, the tournament, the round and the table, so the results do not
+depend on the number of workers. 
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import argparse
+import collections
+import multiprocessing
+import random
+import time
+
+import poker
+from poker_simulation import DECK
+
+
+# a table deals 5 cards to every player from one deck
+MAX_SEATS = len(DECK) // 5
+
+# the number of chunks of tables per worker and round
+CHUNKS_PER_WORKER = 4
+
+TournamentResult = collections.namedtuple('TournamentResult', 
+                                          ['winners', 'rounds', 'tables', 
+                                           'split_pots', 'seconds'])
+
+
+def get_table_random(seed, tournament, round_, table):
+    ''' Get the random generator of a table. It only depends on its seed and
+    position, not on the process that plays the table. 
+    '''
+
+    return(random.Random('{}:{}:{}:{}'.format(seed, tournament, round_, 
+                                              table)))
+
+
+def seat_players(seed, tournament, round_, players, seats):
+    ''' Seat the players of a round at tables of at most seats players, 
+    shuffled and as balanced as possible. 
+    input: the seed, the tournament and the round, the players and the 
+    number of seats of a table
+    return: a list of the players of each table
+    '''
+
+    players = list(players)
+    random.Random('{}:{}:{}'.format(seed, tournament, round_)).shuffle(players)
+    tables = -(-len(players) // seats)
+
+    return([players[table::tables] for table in range(tables)])
+
+
+def play_table(seed, tournament, round_, table, players):
+    ''' Deal a hand to every player of a table and settle it with a 
+    showdown.
+    input: the seed, the tournament, the round and the table, and the players
+    return: the list of the winning players, more than one for a split pot
+    '''
+
+    rng = get_table_random(seed, tournament, round_, table)
+    cards = rng.sample(DECK, 5 * len(players))
+    hands = [''.join(cards[start:start + 5]) 
+             for start in range(0, len(cards), 5)]
+
+    return([players[index] for index in poker.showdown(hands)])
+
+
+def _play_table(args):
+    return(play_table(*args))
+
+
+def simulate_tournaments(players, tournaments=1, seats=9, seed=0, workers=1):
+    ''' Play knockout tournaments, all of them round by round.
+    input: the number of players of a tournament, the number of tournaments,
+    the number of seats of a table, the seed and the number of worker 
+    processes
+    return: a TournamentResult with the winner of each tournament, the number
+    of rounds and of tables played, the number of tables with a split pot and
+    the wall-clock time in seconds
+    '''
+
+    if not 2 <= seats <= MAX_SEATS:
+        raise ValueError('A table has 2 to {} seats'.format(MAX_SEATS))
+    if players < 1:
+        raise ValueError('A tournament needs at least one player')
+
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    fields = [list(range(players)) for tournament in range(tournaments)]
+    rounds = tables = split_pots = 0
+    try:
+        while any(len(field) > 1 for field in fields):
+            tasks = []
+            for tournament, field in enumerate(fields):
+                if len(field) > 1:
+                    for table, seated in enumerate(seat_players(
+                            seed, tournament, rounds, field, seats)):
+                        tasks.append((seed, tournament, rounds, table, seated))
+
+            if pool is None:
+                results = map(_play_table, tasks)
+            else:
+                chunk_size = -(-len(tasks) // (workers * CHUNKS_PER_WORKER))
+                results = pool.imap(_play_table, tasks, chunk_size)
+
+            # the winners of the tables of a tournament are its next field
+            fields = [field if len(field) == 1 else [] for field in fields]
+            for task, winners in zip(tasks, results):
+                fields[task[1]].extend(winners)
+                split_pots += len(winners) > 1
+
+            rounds += 1
+            tables += len(tasks)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return(TournamentResult([field[0] for field in fields], rounds, tables, 
+                            split_pots, time.perf_counter() - start))
+
+
+def report(result):
+    ''' Summarize the throughput of a simulation.
+    return: a dictionary with the 'tournaments', 'rounds', 'tables', 
+    'split_pots', 'seconds' and 'tables_per_second'
+    '''
+
+    return({'tournaments': len(result.winners),
+            'rounds': result.rounds,
+            'tables': result.tables,
+            'split_pots': result.split_pots,
+            'seconds': result.seconds,
+            'tables_per_second': (result.tables / result.seconds 
+                                  if result.seconds else 0.0)
+           })
+
+
+if __name__ == '__main__':
+    '''Main function
+    '''
+
+    parser = argparse.ArgumentParser(description='Simulate knockout poker '
+                                     'tournaments.')
+    parser.add_argument('-p', '--players', type=int, default=1000, 
+                        help='the number of players of a tournament')
+    parser.add_argument('-n', '--tournaments', type=int, default=100)
+    parser.add_argument('--seats', type=int, default=9, 
+                        help='the number of seats of a table')
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-j', '--workers', type=int, default=1, 
+                        help='the number of worker processes')
+    args = parser.parse_args()
+
+    summary = report(simulate_tournaments(args.players, args.tournaments, 
+                                          args.seats, args.seed, args.workers))
+    for name, value in summary.items():
+        print('{:<20} {}'.format(name, value))
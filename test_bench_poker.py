@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the benchmark of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import random
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import bench_poker
+import lib_poker
+
+
+class TestBenchPoker(unittest.TestCase):
+
+    def test_generate_pairs(self):
+        ''' The workloads should give pairs of legal hands of their kind. '''
+
+        for workload in bench_poker.WORKLOADS:
+            pairs = bench_poker.generate_pairs(workload, 100, random.Random(0))
+            self.assertEqual(len(pairs), 100)
+            for hand_1, hand_2 in pairs:
+                self.assertGreaterEqual(lib_poker.get_hand_strength(hand_1), 0)
+                self.assertGreaterEqual(lib_poker.get_hand_strength(hand_2), 0)
+                if workload == 'ties':
+                    self.assertEqual(sorted(hand_1), sorted(hand_2))
+
+        pairs = bench_poker.generate_pairs('uniform', 20, random.Random(0), 6)
+        for hand_1, hand_2 in pairs:
+            self.assertEqual(lib_poker.check_card_combination_type(hand_1), 6)
+            self.assertEqual(lib_poker.check_card_combination_type(hand_2), 6)
+
+    def test_run_benchmarks(self):
+        ''' Every tie-breaker should run on its own combination type and the 
+        results should be compared with a baseline. 
+        '''
+
+        results = bench_poker.run_benchmarks(count=50, cli_runs=0, 
+                                             name_filter='get_winner_in')
+        self.assertEqual(len(results['results']), 
+                         len(bench_poker.TIE_BREAKERS) * 
+                         len(bench_poker.WORKLOADS))
+
+        baseline = {'results': {
+                name: dict(measurement, 
+                           ops_per_sec=measurement['ops_per_sec'] * 2)
+                for name, measurement in results['results'].items()}}
+        self.assertEqual(len(bench_poker.compare_results(results, baseline)), 
+                         len(results['results']))
+        self.assertEqual(bench_poker.compare_results(results, results), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
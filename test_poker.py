@@ -26,8 +26,32 @@ no flushes, straights, and straight flushes.
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import collections
+import io
+import itertools
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest 
+import zlib
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import lib_poker
 import poker
+import poker_rules
+
+# the largest time to import poker with saved tables, in microseconds
+IMPORT_BUDGET_US = 50000
+
+# modules that only some modes of the game need
+LAZY_MODULES = ('threading', 'json', 'argparse', 'multiprocessing', 'asyncio',
+                'numpy', 'mmap')
+
 
 class TestPoker(unittest.TestCase):
     tie_cases = (('aaaqq', 'qqaaa'), 
@@ -52,7 +76,8 @@ class TestPoker(unittest.TestCase):
                        ('99975', '99965'),
                        ('99752', '99652'),
                        ('99752', '99742'),
-                       ('99753', '99752'))
+                       ('99753', '99752'),
+                       ('44k9k', 'kk229'))
 
     second_win_cases = (('qqqaa', 'aaaqq'),
                         ('53qq2', 'q53q4'),
@@ -68,7 +93,8 @@ class TestPoker(unittest.TestCase):
                         ('99965', '99975'),
                         ('99652', '99752'),
                         ('99742', '99752'),
-                        ('99752', '99753'))
+                        ('99752', '99753'),
+                        ('kk229', '44k9k'))
 
     fail_cases = (('123', '45654'),
                   ('88889', 'aqj'),
@@ -106,6 +132,402 @@ class TestPoker(unittest.TestCase):
             winner = poker.who_wins(hand_1.upper(), hand_2.upper())
             self.assertEqual(winner, -1)
 
+        # every module compares strengths with the same rule
+        for strength_1, strength_2, winner in ((5, 3, 1), (3, 5, 2), 
+                                               (4, 4, 0), (-1, 4, -1),
+                                               (4, -1, -1), (-1, -1, -1)):
+            self.assertEqual(lib_poker.compare_strengths(strength_1, 
+                                                         strength_2), winner)
+
+    def test_tie_breakers(self):
+        ''' The tie-breaker of each combination type should agree with 
+        who_wins on hands of that type. 
+        '''
+
+        tie_breakers = {1: lib_poker.get_winner_in_high_card, 
+                        2: lib_poker.get_winner_in_pairs, 
+                        3: lib_poker.get_winner_in_two_pairs, 
+                        4: lib_poker.get_winner_in_triples, 
+                        5: lib_poker.get_winner_in_full_house, 
+                        6: lib_poker.get_winner_in_four_a_kind}
+        hands_by_type = collections.defaultdict(list)
+        for strength, hand in enumerate(lib_poker.HANDS_BY_STRENGTH):
+            hands_by_type[lib_poker.COMBINATION_TYPE_BY_STRENGTH[
+                    strength]].append(hand)
+
+        rng = random.Random(1)
+        for combination_type, hands in hands_by_type.items():
+            for _ in range(2000):
+                hand_1, hand_2 = rng.choice(hands), rng.choice(hands)
+                self.assertEqual(tie_breakers[combination_type](
+                        lib_poker.order_cards_by_value(hand_1), 
+                        lib_poker.order_cards_by_value(hand_2)), 
+                    poker.who_wins(hand_1, hand_2), (hand_1, hand_2))
+
+        self.assertEqual(lib_poker.get_winner_in_two_pairs(
+                lib_poker.order_cards_by_value('44K9K'), 
+                lib_poker.order_cards_by_value('KK229')), 1)
+
+    def test_four_of_a_kind(self):
+        ''' Hands with the same four cards should be decided by the single
+        card, without changing the lists of cards they get. 
+        '''
+
+        for hand_1, hand_2, winner in (('3333K', '3333Q', 1), 
+                                       ('3333Q', 'K3333', 2),
+                                       ('Q3333', '333Q3', 0),
+                                       ('2AAAA', 'KKKKQ', 1)):
+            cards_1 = lib_poker.order_cards_by_value(hand_1)
+            cards_2 = lib_poker.order_cards_by_value(hand_2)
+            self.assertEqual(lib_poker.get_winner_in_four_a_kind(
+                    cards_1, cards_2), winner)
+            self.assertEqual(cards_1, lib_poker.order_cards_by_value(hand_1))
+            self.assertEqual(cards_2, lib_poker.order_cards_by_value(hand_2))
+
+    def test_strength_table(self):
+        ''' The strength table should rank every possible hand once, order 
+        the hands by combination type first and give -1 to impossible hands.
+        '''
+
+        self.assertEqual(len(lib_poker.STRENGTH_TABLE), 6175)
+        self.assertEqual(sorted(lib_poker.STRENGTH_TABLE.values()), 
+                         list(range(6175)))
+
+        by_strength = sorted(lib_poker.STRENGTH_TABLE, 
+                             key=lib_poker.STRENGTH_TABLE.get)
+        types = [lib_poker.check_card_combination_type(hand) 
+                 for hand in by_strength]
+        self.assertEqual(types, sorted(types))
+
+        self.assertEqual(lib_poker.get_hand_strength('AAAQQ'), 
+                         lib_poker.get_hand_strength('QAQAA'))
+        for hand in ('22222', 'AAAQ', 'AAAQQ2', 'aaaqq', 'XAAQQ'):
+            self.assertEqual(lib_poker.get_hand_strength(hand), -1)
+
+    def test_hand_key(self):
+        ''' hand_key should order hands like who_wins and start with the 
+        combination type given by check_card_combination_type. 
+        '''
+
+        for hand in lib_poker.STRENGTH_TABLE:
+            self.assertEqual(lib_poker.hand_key(hand)[0],
+                             lib_poker.check_card_combination_type(hand))
+
+        for hand_1, hand_2 in self.tie_cases:
+            self.assertEqual(lib_poker.hand_key(hand_1.upper()), 
+                             lib_poker.hand_key(hand_2.upper()))
+
+        for hand_1, hand_2 in self.first_win_cases:
+            self.assertGreater(lib_poker.hand_key(hand_1.upper()), 
+                               lib_poker.hand_key(hand_2.upper()))
+
+        self.assertEqual(sorted(['99975', '22AAA', 'AKQJ9', '99974'], 
+                                key=lib_poker.hand_key),
+                         ['AKQJ9', '99974', '99975', '22AAA'])
+
+        for hand_1, hand_2 in self.fail_cases: 
+            self.assertIn((-1,), (lib_poker.hand_key(hand_1.upper()), 
+                                  lib_poker.hand_key(hand_2.upper())))
+
+    def test_run_batch(self):
+        ''' run_batch should write one result per input line and report
+        illegal lines without stopping. 
+        '''
+
+        in_file = io.StringIO('aaaqq qqqaa\n'
+                              'qqqaa aaaqq\n'
+                              'xyzak\n'
+                              'aaaqq qqaaa\n'
+                              'kkkk jjjjj\n')
+        out_file = io.StringIO()
+
+        count = poker.run_batch(in_file, out_file, buffer_lines=2)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(out_file.getvalue().splitlines(), 
+                         ['First hand wins!',
+                          'Second hand wins!',
+                          'Error: Please insert cards in hand_1 and hand_2',
+                          'It\'s a tie!',
+                          'Error: The first hand must contain 5 cards. '
+                          'Please try again.'])
+
+    def test_showdown(self):
+        ''' showdown should give the indices of the winning hands and 
+        rank_hands should group the hands that tie, strongest first. 
+        '''
+
+        hands = ['99752', 'AAAQQ', '22456', 'QQAAA', 'AKQJT', '99742']
+
+        self.assertEqual(poker.showdown(hands), [1, 3])
+        self.assertEqual(poker.showdown(hands[2:]), [1])
+        self.assertEqual(poker.showdown([]), [])
+        self.assertEqual(poker.rank_hands(hands), 
+                         [[1, 3], [0], [5], [2], [4]])
+        self.assertEqual(poker.rank_hands([]), [])
+
+        with self.assertRaises(ValueError):
+            poker.showdown(['AAAQQ', 'KKKK'])
+
+    def test_best_hand(self):
+        ''' The best hand of 7 cards should be the strongest of its 21 hands
+        of 5 cards. 
+        '''
+
+        self.assertEqual(lib_poker.get_best_hand('222233A'), '2222A')
+        self.assertEqual(lib_poker.get_best_hand('223344A'), '4433A')
+        self.assertEqual(lib_poker.get_best_hand('KKKQQQ2'), 'KKKQQ')
+        self.assertEqual(lib_poker.get_best_hand('AAAAA23'), '')
+        self.assertEqual(lib_poker.get_best_hand('AAXK234'), '')
+        self.assertEqual(lib_poker.get_best_strength('AAK2'), -1)
+        self.assertEqual(lib_poker.get_best_strength('AAKK2233'), -1)
+        self.assertNotIn('2233AAKK', lib_poker.BEST_STRENGTH_TABLE)
+
+        rng = random.Random(7)
+        deck = [card for card in lib_poker.CARD_SET for copy in range(4)]
+        for deal in range(500):
+            cards = ''.join(rng.sample(deck, 7))
+            self.assertEqual(lib_poker.get_best_strength(cards), 
+                             max(lib_poker.get_hand_strength(hand) for hand in
+                                 itertools.combinations(cards, 5)))
+
+        self.assertEqual(poker.who_wins_shared('AK', 'QQ', '23456'), 2)
+        self.assertEqual(poker.who_wins_shared('22', '33', 'AAKKQ'), 0)
+        self.assertEqual(poker.who_wins_shared('KK', '33', 'AAKQ3'), 1)
+        self.assertEqual(poker.who_wins_shared('AA', 'AA', 'AKQJ9'), -1)
+        self.assertEqual(poker.who_wins_shared('AX', 'QQ', 'AKQJ9'), -1)
+        self.assertEqual(poker.who_wins_shared('AK', 'QQ', 'AKQJ9T'), -1)
+
+    def test_packed_hand(self):
+        ''' Packed hands should give the strengths and the winners of the 
+        hands, and should be checked with integer arithmetic. 
+        '''
+
+        for strength, hand in enumerate(lib_poker.HANDS_BY_STRENGTH):
+            packed = lib_poker.pack_hand(hand)
+            self.assertEqual(lib_poker.get_packed_strength(packed), strength)
+            self.assertEqual(lib_poker.count_packed_cards(packed), 5)
+            self.assertEqual(sorted(lib_poker.unpack_hand(packed)), 
+                             sorted(hand))
+
+        packed = lib_poker.pack_hand('AAKQ')
+        self.assertEqual(lib_poker.unpack_hand(packed), 'AAKQ')
+        self.assertEqual(lib_poker.add_card(packed, '2'), 
+                         lib_poker.pack_hand('2AQKA'))
+        self.assertEqual(lib_poker.remove_card(packed, 'A'), 
+                         lib_poker.pack_hand('AKQ'))
+        self.assertEqual(lib_poker.merge_packed(packed, 
+                                                lib_poker.pack_hand('AA')),
+                         lib_poker.pack_hand('AAAAKQ'))
+        self.assertEqual(lib_poker.merge_packed(packed, 
+                                                lib_poker.pack_hand('AAA')),
+                         -1)
+        for count in range(16):
+            self.assertEqual(lib_poker.is_valid_packed(
+                lib_poker.pack_hand('K' * count + '2')), count <= 4)
+        with self.assertRaises(ValueError):
+            lib_poker.remove_card(packed, '2')
+        with self.assertRaises(ValueError):
+            lib_poker.pack_hand('AAKQX')
+        # 16 cards of a value would not fit in its 4 bits
+        self.assertEqual(lib_poker.unpack_hand(lib_poker.pack_hand('K' * 15)),
+                         'K' * 15)
+        with self.assertRaises(ValueError):
+            lib_poker.pack_hand('2' + 'K' * 16)
+        with self.assertRaises(ValueError):
+            lib_poker.add_card(lib_poker.pack_hand('K' * 15), 'K')
+
+        packed_hands = lib_poker.pack_hands(['AAAQQ', 'QQAAA', 'AAAAA'])
+        self.assertEqual(packed_hands.typecode, 'Q')
+        self.assertEqual(list(lib_poker.get_packed_strengths(packed_hands)), 
+                         [lib_poker.get_hand_strength('AAAQQ')] * 2 + [-1])
+
+        for hand_1, hand_2 in (self.first_win_cases + self.tie_cases +
+                               self.second_win_cases):
+            hand_1, hand_2 = hand_1.upper(), hand_2.upper()
+            packed_1 = lib_poker.pack_hand(hand_1)
+            packed_2 = lib_poker.pack_hand(hand_2)
+            self.assertEqual(poker.who_wins_packed(packed_1, packed_2), 
+                             poker.who_wins(hand_1, hand_2))
+
+    def test_cache(self):
+        ''' The opt-in cache should share entries between hands with the same
+        cards, evict the least recently used entry and count its use. 
+        '''
+
+        self.assertIsNone(lib_poker.cache_info())
+        lib_poker.enable_cache(maxsize=2)
+        try:
+            self.assertEqual(lib_poker.check_card_combination_type('53QQ2'), 2)
+            self.assertEqual(lib_poker.check_card_combination_type('Q53Q2'), 2)
+            self.assertEqual(poker.get_winer_same_combination('99975', 
+                                                              '99974', 4), 1)
+            self.assertEqual(poker.get_winer_same_combination('79995', 
+                                                              '49979', 4), 1)
+            self.assertEqual(lib_poker.check_card_combination_type('AAAQQ'), 5)
+            self.assertEqual(lib_poker.cache_info(), 
+                             lib_poker.CacheInfo(hits=2, misses=3, 
+                                                 evictions=1, maxsize=2, 
+                                                 currsize=2))
+
+            lib_poker.cache_clear()
+            self.assertEqual(lib_poker.cache_info(), 
+                             lib_poker.CacheInfo(0, 0, 0, 2, 0))
+
+            # the cache should keep working from several threads
+            lib_poker.enable_cache(maxsize=64)
+            hands = list(lib_poker.STRENGTH_TABLE)[:200]
+            errors = []
+
+            def classify():
+                for hand in hands:
+                    if lib_poker.check_card_combination_type(hand) != \
+                            lib_poker.hand_key(hand)[0]:
+                        errors.append(hand)
+
+            threads = [threading.Thread(target=classify) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            info = lib_poker.cache_info()
+            self.assertEqual(info.hits + info.misses, 4 * len(hands))
+            self.assertEqual(info.currsize, 64)
+        finally:
+            lib_poker.disable_cache()
+
+    def test_hand(self):
+        ''' A Hand should be parsed once, compare by strength and be accepted
+        by the functions that take a hand. 
+        '''
+
+        hand = lib_poker.Hand('QAQAA')
+
+        self.assertEqual(str(hand), 'AAAQQ')
+        self.assertEqual(hand.counts, (0,) * 10 + (2, 0, 3))
+        self.assertEqual(hand.combination_type, 5)
+        self.assertEqual(hand.key, lib_poker.hand_key('QAQAA'))
+        self.assertEqual(hand, lib_poker.Hand('AAAQQ'))
+        self.assertEqual(len({hand, lib_poker.Hand('AQAQA')}), 1)
+        self.assertGreater(hand, lib_poker.Hand('QQQAA'))
+        self.assertEqual(sorted([hand, lib_poker.Hand('23456')]), 
+                         [lib_poker.Hand('65432'), hand])
+
+        with self.assertRaises(AttributeError):
+            hand.strength = 0
+        for cards in ('22222', 'AAAQ', 'XAAQQ'):
+            with self.assertRaises(ValueError):
+                lib_poker.Hand(cards)
+
+        for predicate in ('is_full_house', 'is_four_of_a_kind', 'is_triples',
+                          'is_two_pairs', 'is_pair', 'is_high_card', 
+                          'check_card_combination_type', 'hand_key', 
+                          'get_hand_strength', 'order_cards_by_value'):
+            function = getattr(lib_poker, predicate)
+            self.assertEqual(function(hand), function('QAQAA'))
+
+        self.assertEqual(lib_poker.get_winner_in_triples(
+                lib_poker.Hand('99975'), lib_poker.Hand('79994')), 1)
+        self.assertEqual(poker.who_wins(hand, lib_poker.Hand('QQQAA')), 1)
+        self.assertEqual(poker.showdown([hand, 'QQQAA', 'AQAQA']), [0, 2])
+
+    def test_saved_tables(self):
+        ''' Saved tables should load back as built, and missing, damaged or
+        stale files should be rejected. 
+        '''
+
+        tables = lib_poker.build_tables()
+        self.assertEqual(tables, (lib_poker.HANDS_BY_STRENGTH, 
+                                  lib_poker.COMBINATION_TYPE_BY_STRENGTH))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache', 'tables.bin')
+            self.assertIsNone(lib_poker.load_tables(path))
+
+            lib_poker.save_tables(path, *tables)
+            self.assertEqual(lib_poker.load_tables(path), tables)
+
+            with open(path, 'rb') as the_file:
+                data = the_file.read()
+            header, body = data.split(b'\n', 1)
+            name, version, fingerprint, count, crc = header.split()
+
+            def with_crc(body):
+                return(b' '.join([name, version, fingerprint, count, 
+                                  str(zlib.crc32(body)).encode('ascii')]) + 
+                       b'\n' + body)
+
+            first_five = b'AAAAA' + body[5:]
+            bad_type = body[:-1] + b'\x09'
+            for damaged in (b' '.join([name, b'0', fingerprint, count, crc]) +
+                            b'\n' + body,
+                            b' '.join([name, version, fingerprint + b'1', 
+                                       count, crc]) + b'\n' + body,
+                            data[:-1],
+                            # same length, the CRC no longer matches
+                            header + b'\n' + first_five,
+                            header + b'\n' + bad_type,
+                            # same length and a matching CRC
+                            with_crc(first_five),
+                            with_crc(bad_type),
+                            with_crc(body[5:10] + body[5:])):
+                with open(path, 'wb') as the_file:
+                    the_file.write(damaged)
+                self.assertIsNone(lib_poker.load_tables(path))
+
+        # another order of the hands makes the saved tables stale
+        fingerprint = lib_poker.get_tables_fingerprint()
+        get_rules_key = poker_rules.get_rules_key
+        poker_rules.get_rules_key = lambda hand: get_rules_key(hand)[::-1]
+        try:
+            self.assertNotEqual(lib_poker.get_tables_fingerprint(), 
+                                fingerprint)
+        finally:
+            poker_rules.get_rules_key = get_rules_key
+
+    def test_import_time(self):
+        ''' Importing poker with saved tables should stay within its time 
+        budget and should not import the modules of the other modes.
+        '''
+
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, POKER_CACHE_DIR=directory)
+            command = [sys.executable, '-X', 'importtime', '-c', 
+                       'import poker, sys; print(" ".join(sys.modules))']
+            cwd = os.path.dirname(os.path.abspath(__file__))
+
+            # the first import builds and saves the tables
+            subprocess.run(command, env=env, cwd=cwd, check=True, 
+                           capture_output=True)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            path = os.path.join(directory, os.listdir(directory)[0])
+            saved = os.stat(path).st_mtime_ns
+
+            # the second import loads the tables without saving them again
+            result = subprocess.run(command, env=env, cwd=cwd, check=True, 
+                                    capture_output=True, text=True)
+            self.assertEqual(os.stat(path).st_mtime_ns, saved)
+
+        modules = result.stdout.split()
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+
+        import_times = {line.split('|')[2].strip(): 
+                        int(line.split('|')[1]) 
+                        for line in result.stderr.splitlines()
+                        if line.startswith('import time:') and 
+                        line.split('|')[1].strip().isdigit()}
+        self.assertLess(import_times['poker'], IMPORT_BUDGET_US)
+
+# all the pairs of hands of the fixtures, upper-cased, for the tests of the 
+# other modules
+ALL_CASES = tuple((hand_1.upper(), hand_2.upper()) for hand_1, hand_2 in 
+                  TestPoker.tie_cases + TestPoker.first_win_cases + 
+                  TestPoker.second_win_cases + TestPoker.fail_cases)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the binary file format of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import struct
+import tempfile
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import lib_poker
+import poker
+import poker_binary
+import poker_shared
+
+
+class TestPokerBinary(unittest.TestCase):
+
+    def setUp(self):
+        self.cases = list(ALL_CASES)
+
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_matchup_file(self):
+        ''' A written matchup file should give back the canonical hands and 
+        the winners of poker.who_wins. 
+        '''
+
+        count = poker_binary.write_matchups(self.path, self.cases)
+        self.assertEqual(count, len(self.cases))
+        self.assertEqual(os.path.getsize(self.path), 
+                         poker_binary.HEADER.size + 4 * count)
+
+        with poker_binary.MatchupFile(self.path) as matchups:
+            self.assertEqual(len(matchups), len(self.cases))
+            self.assertEqual(matchups[0], ('AAAQQ', 'AAAQQ'))
+            self.assertEqual(matchups[-1], (None, None))
+
+            self.assertEqual(matchups.winners().tolist(), 
+                             [poker.who_wins(hand_1, hand_2) 
+                              for hand_1, hand_2 in self.cases])
+
+    def test_codes(self):
+        ''' Every possible hand should round trip through its code. '''
+
+        for hand in lib_poker.STRENGTH_TABLE:
+            code = poker_binary.encode_hand(hand)
+            self.assertEqual(poker_binary.decode_hand(code), hand)
+
+        # the codes do not depend on the evaluation tables
+        self.assertEqual(poker_binary.encode_hand('QAQAA'), 
+                         poker_shared.get_index('AAAQQ'))
+        for hand in ('22222', 'AAAQ', 'XAAQQ'):
+            self.assertEqual(poker_binary.encode_hand(hand), 
+                             poker_binary.INVALID_CODE)
+        for code in (poker_binary.INVALID_CODE, poker_shared.INDEX_SIZE, 
+                     poker_shared.get_index('22222')):
+            self.assertIsNone(poker_binary.decode_hand(code))
+
+    def test_bad_file(self):
+        ''' A file without the header, too short, truncated or of another
+        version should not be opened, and codes out of range should fail.
+        '''
+
+        poker_binary.write_matchups(self.path, self.cases)
+        with open(self.path, 'rb') as the_file:
+            data = the_file.read()
+        other_version = poker_binary.HEADER.pack(poker_binary.MAGIC, 2)
+
+        for bad_data in (b'AAAQQ QQQAA\n', b'PKRM', data[:-1], 
+                         other_version + data[poker_binary.HEADER.size:]):
+            with open(self.path, 'wb') as the_file:
+                the_file.write(bad_data)
+
+            with self.assertRaises(ValueError):
+                poker_binary.MatchupFile(self.path)
+
+        with open(self.path, 'wb') as the_file:
+            the_file.write(data[:poker_binary.HEADER.size] + 
+                           struct.pack('<HH', poker_shared.INDEX_SIZE, 
+                                       poker_shared.get_index('22223')))
+        with poker_binary.MatchupFile(self.path) as matchups:
+            self.assertEqual(matchups.winners().tolist(), [-1])
+            self.assertEqual(matchups[0], (None, '22223'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the discard optimizer of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import math
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import lib_poker
+import poker_draw
+
+
+class TestPokerDraw(unittest.TestCase):
+
+    def test_get_draws(self):
+        ''' The draws should cover every card combination of the deck. '''
+
+        deck = [4] * 13
+        deck[0] = 2
+        for size, (packed, ways) in enumerate(poker_draw.get_draws(deck)):
+            self.assertEqual(len(set(packed)), len(packed))
+            self.assertEqual(sum(ways), math.comb(50, size))
+
+    def test_evaluate_discards(self):
+        ''' Each discard should get the outcome of drawing every single card
+        of the rest of the deck, one by one. 
+        '''
+
+        hand = 'QQJ73'
+        options = poker_draw.evaluate_discards(hand)
+        self.assertEqual(len(options), 32)
+        self.assertEqual(sorted(options, key=lambda option: -option.equity), 
+                         options)
+
+        distribution = poker_draw.reference_distribution()
+        self.assertAlmostEqual(sum(distribution), 1.0)
+        deck = [card for card in lib_poker.CARD_SET for copy in range(4)]
+        for card in hand:
+            deck.remove(card)
+
+        for option in options:
+            self.assertAlmostEqual(option.win + option.tie + option.loss, 1.0)
+            if len(option.discard) != 1:
+                continue
+            win = tie = 0.0
+            for card in deck:
+                drawn = hand.replace(option.discard, card, 1)
+                strength = lib_poker.get_hand_strength(drawn)
+                win += sum(distribution[:strength]) / len(deck)
+                tie += distribution[strength] / len(deck)
+            self.assertAlmostEqual(option.win, win)
+            self.assertAlmostEqual(option.tie, tie)
+
+    def test_best_discard(self):
+        ''' The best discard should keep the strongest cards. '''
+
+        self.assertEqual(poker_draw.best_discard('AAAAK').discard, '')
+        self.assertEqual(poker_draw.best_discard('KKK23').discard, '23')
+        self.assertEqual(poker_draw.best_discard('QQJJ2').discard, '2')
+
+        # against the weakest hand only, keeping it can only tie
+        opponent = [1] + [0] * (len(lib_poker.HANDS_BY_STRENGTH) - 1)
+        weakest = lib_poker.HANDS_BY_STRENGTH[0]
+        options = poker_draw.evaluate_discards(weakest, opponent)
+        self.assertEqual(options[-1].discard, '')
+        self.assertEqual(options[-1].tie, 1.0)
+
+        for hand in ('AAAAA', 'AAQQ', 'AAQQX'):
+            with self.assertRaises(ValueError):
+                poker_draw.evaluate_discards(hand)
+        with self.assertRaises(ValueError):
+            poker_draw.evaluate_discards('AAQQK', [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
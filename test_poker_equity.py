@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the exact equity of hands of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import math
+import os
+import tempfile
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import lib_poker
+import poker
+import poker_equity
+
+
+class TestPokerEquity(unittest.TestCase):
+
+    def test_iter_draws(self):
+        ''' The draws should cover every card combination of the deck. '''
+
+        deck = poker_equity.get_deck('AAK', 'Q')
+        for size in range(6):
+            self.assertEqual(sum(ways for cards, ways in 
+                                 poker_equity.iter_draws(deck, size)), 
+                             math.comb(sum(deck), size))
+
+    def test_count_outcomes(self):
+        ''' Four of a kind of the lowest value should only lose to the other
+        possible fours of a kind. 
+        '''
+
+        hand = '22223'
+        outcomes = poker_equity.count_outcomes(
+                lib_poker.get_hand_strength(hand), 
+                poker_equity.get_deck(hand))
+
+        # 11 values can still make four of a kind, each with 43 kickers
+        self.assertEqual(outcomes, (math.comb(47, 5) - 11 * 43, 0, 11 * 43))
+
+        # the weakest hand is counted from the other side and only ties 
+        # with the same values
+        hand = '23456'
+        outcomes = poker_equity.count_outcomes(
+                lib_poker.get_hand_strength(hand), 
+                poker_equity.get_deck(hand))
+        self.assertEqual(outcomes, (0, 3 ** 5, math.comb(47, 5) - 3 ** 5))
+
+    def test_exact_equity(self):
+        ''' The probabilities should add up to 1 and follow the strength of 
+        the known cards. 
+        '''
+
+        self.assertEqual(poker_equity.exact_equity('AAAAK'), (1.0, 0.0, 0.0))
+
+        previous = 0.0
+        for known in ('22', '222', '2222'):
+            equity = poker_equity.exact_equity(known)
+            self.assertAlmostEqual(sum(equity), 1.0)
+            self.assertGreater(equity.win, previous)
+            previous = equity.win
+
+        # without known cards both hands come from the same deck
+        equity = poker_equity.exact_equity('', dead='22223333')
+        self.assertEqual(equity.win, equity.loss)
+        deck = poker_equity.get_deck('22223333')
+        outcomes = [0, 0, 0]
+        for hand, ways in poker_equity.iter_draws(deck, 5):
+            hand_outcomes = poker_equity.count_outcomes(
+                    lib_poker.get_hand_strength(hand), 
+                    poker_equity.get_deck(hand, '22223333'))
+            for index in range(3):
+                outcomes[index] += ways * hand_outcomes[index]
+        for value, expected in zip(equity, outcomes):
+            self.assertAlmostEqual(value, expected / sum(outcomes))
+
+        self.assertNotEqual(poker_equity.exact_equity('AK'), 
+                            poker_equity.exact_equity('AK', dead='AAQ'))
+
+        for known, dead in (('AAAQQ2', ''), ('X', ''), ('AAA', 'AA')):
+            with self.assertRaises(ValueError):
+                poker_equity.exact_equity(known, dead)
+
+
+    def test_saved_outcomes(self):
+        ''' The saved outcomes of the full hands should give the equity of 
+        partial hands, and missing, damaged or stale files should be 
+        rejected. 
+        '''
+
+        outcomes = poker_equity.get_outcomes()
+        self.assertEqual(len(outcomes), 3 * lib_poker.POSSIBLE_HANDS)
+        for hand in ('22223', '23456', 'AAAQQ'):
+            strength = lib_poker.get_hand_strength(hand)
+            self.assertEqual(tuple(outcomes[3 * strength:3 * strength + 3]), 
+                             poker_equity.count_outcomes(
+                                     strength, poker_equity.get_deck(hand)))
+
+        # the same sum as _exact_equity with dead cards
+        known = 'AK'
+        expected = [0, 0, 0]
+        for cards, ways in poker_equity.iter_draws(
+                poker_equity.get_deck(known), 3):
+            strength = lib_poker.get_hand_strength(known + cards)
+            if strength >= 0:
+                for index, count in enumerate(poker_equity.count_outcomes(
+                        strength, poker_equity.get_deck(known + cards))):
+                    expected[index] += ways * count
+        for value, count in zip(poker_equity.exact_equity(known), expected):
+            self.assertAlmostEqual(value, count / sum(expected))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache', 'outcomes.bin')
+            self.assertIsNone(poker_equity.load_outcomes(path))
+
+            poker_equity.save_outcomes(path, outcomes)
+            self.assertEqual(poker_equity.load_outcomes(path), outcomes)
+
+            with open(path, 'rb') as the_file:
+                data = the_file.read()
+            header, body = data.split(b'\n', 1)
+            name, version, fingerprint, count, crc = header.split()
+            for damaged in (b' '.join([name, version, fingerprint + b'1', 
+                                       count, crc]) + b'\n' + body,
+                            data[:-1],
+                            header + b'\n' + b'\xff' + body[1:]):
+                with open(path, 'wb') as the_file:
+                    the_file.write(damaged)
+                self.assertIsNone(poker_equity.load_outcomes(path))
+
+    def test_hand_range(self):
+        ''' The equity against a range should weigh the outcomes of who_wins
+        against each hand of the range. 
+        '''
+
+        hands = ['AAAQQ', '99752', 'QQAAA', '22456', 'KK223', '99752']
+        weights = [1, 2, 3, 4, 5, 6]
+        hand_range = poker_equity.HandRange(hands, weights)
+
+        for hand in ('AAAQQ', '99752', '23457', 'AAAAK', 'KK223'):
+            # the index of each winner of who_wins in (win, tie, loss)
+            index = {1: 0, 0: 1, 2: 2}
+            outcomes = [0, 0, 0]
+            for opponent, weight in zip(hands, weights):
+                outcomes[index[poker.who_wins(hand, opponent)]] += weight
+            expected = [outcome / sum(weights) for outcome in outcomes]
+            for value, expected_value in zip(hand_range.equity(hand), 
+                                             expected):
+                self.assertAlmostEqual(value, expected_value)
+
+        by_strength = hand_range.weights_by_strength()
+        self.assertEqual(sum(by_strength), sum(weights))
+        self.assertEqual(by_strength[lib_poker.get_hand_strength('99752')], 8)
+        self.assertEqual(poker_equity.HandRange(['KK223']).equity('KK322'), 
+                         (0.0, 1.0, 0.0))
+
+        with self.assertRaises(ValueError):
+            hand_range.equity('AAAAA')
+        for hands, weights in ((['AAAQQ', 'KKKK'], None), (['AAAQQ'], [1, 2]),
+                               ([], None), (['AAAQQ'], [-1])):
+            with self.assertRaises(ValueError):
+                poker_equity.HandRange(hands, weights)
+
+if __name__ == '__main__':
+    unittest.main()
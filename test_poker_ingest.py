@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the CSV and JSON Lines ingest of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import io
+import json
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import poker
+import poker_ingest
+
+
+class TestPokerIngest(unittest.TestCase):
+
+    pairs = ALL_CASES
+    winners = [poker.who_wins(hand_1, hand_2) for hand_1, hand_2 in pairs]
+
+    def test_ingest_csv(self):
+        ''' The rows should keep their other columns and get the winners of
+        who_wins, for any chunk size. 
+        '''
+
+        lines = ['game_id,hand_1,time,hand_2'] + [
+            '{},{},"2026-10-18, {}",{}'.format(game, hand_1, game, hand_2) 
+            for game, (hand_1, hand_2) in enumerate(self.pairs)]
+        text = '\n'.join(lines + ['99,AAKKQ']) + '\n'
+
+        outputs = []
+        for chunk_size in (1, 7, 1000):
+            out_file = io.StringIO()
+            summary = poker_ingest.ingest_csv(io.StringIO(text), out_file, 
+                                              chunk_size=chunk_size)
+            outputs.append(out_file.getvalue())
+        self.assertEqual(len(set(outputs)), 1)
+
+        rows = outputs[0].splitlines()
+        self.assertEqual(rows[0], 'game_id,hand_1,time,hand_2,winner')
+        self.assertEqual(rows[1:-1], ['{},{}'.format(line, winner) 
+                                      for line, winner in 
+                                      zip(lines[1:], self.winners)])
+        self.assertEqual(rows[-1], '99,AAKKQ,,,-1')
+        self.assertEqual(summary[-1], self.winners.count(-1) + 1)
+
+        with self.assertRaises(ValueError):
+            poker_ingest.ingest_csv(io.StringIO('hand_1,hand\n'), 
+                                    io.StringIO())
+
+    def test_ingest_jsonl(self):
+        ''' The objects should keep their other fields and get the winners 
+        of who_wins, and a bad line should not stop the file. 
+        '''
+
+        lines = [json.dumps({'game_id': game, 'hand_1': hand_1, 'hand_2': 
+                             hand_2}) for game, (hand_1, hand_2) in 
+                 enumerate(self.pairs)]
+        text = '\n'.join(lines[:3] + ['not json', '', '[1]'] + lines[3:] + 
+                         ['{"hand_1": 5, "hand_2": "AAKKQ"}']) + '\n'
+        out_file = io.StringIO()
+        summary = poker_ingest.ingest_jsonl(io.StringIO(text), out_file, 
+                                            columns=('hand_1', 'hand_2'), 
+                                            result_column='result', 
+                                            chunk_size=4)
+
+        records = [json.loads(line) for line in 
+                   out_file.getvalue().splitlines()]
+        self.assertEqual(len(records), len(self.pairs) + 3)
+        self.assertEqual([record['result'] for record in records], 
+                         self.winners[:3] + [-1, -1] + self.winners[3:] + 
+                         [-1])
+        self.assertEqual(records[5]['game_id'], 3)
+        self.assertIn('error', records[3])
+        self.assertEqual(records[3]['raw'], 'not json')
+        self.assertEqual(records[4]['raw'], '[1]')
+        self.assertEqual(sum(summary.values()), len(records))
+
+    def test_evaluate_pairs(self):
+        ''' The winners should be the ones of who_wins, with the same hands.
+        '''
+
+        hands_1 = [hand_1.lower() for hand_1, hand_2 in self.pairs]
+        hands_2 = [hand_2.lower() for hand_1, hand_2 in self.pairs]
+        self.assertEqual(poker_ingest.evaluate_pairs(hands_1, hands_2), 
+                         [poker.who_wins(hand_1, hand_2) 
+                          for hand_1, hand_2 in zip(hands_1, hands_2)])
+        self.assertEqual(poker_ingest.evaluate_pairs(
+                [hand.upper() for hand in hands_1], 
+                [hand.upper() for hand in hands_2]), self.winners)
+        self.assertEqual(poker_ingest.read_hand('aaaqq'), 'AAAQQ')
+        self.assertEqual(poker_ingest.read_hand(5), '')
+
+    def test_get_format(self):
+        ''' The format should follow the extension of the file. '''
+
+        self.assertEqual(poker_ingest.get_format('games.JSONL'), 'jsonl')
+        self.assertEqual(poker_ingest.get_format('games.ndjson'), 'jsonl')
+        self.assertEqual(poker_ingest.get_format('games.csv'), 'csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
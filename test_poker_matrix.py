@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the outcome matrix of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import tempfile
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import lib_poker
+import poker
+import poker_matrix
+
+
+class TestPokerMatrix(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        handle, cls.path = tempfile.mkstemp()
+        os.close(handle)
+        cls.size = poker_matrix.build_outcome_matrix(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.path)
+
+    def test_size(self):
+        ''' The matrix should take 2 bits per pair of hands. '''
+
+        self.assertEqual(os.path.getsize(self.path), self.size)
+        self.assertLess(self.size, 6175 * 6175 // 4 + 6175 + 
+                        poker_matrix.HEADER.size)
+
+    def test_who_wins(self):
+        ''' The matrix should give the winners of poker.who_wins. '''
+
+        with poker_matrix.OutcomeMatrix(self.path) as matrix:
+            for hand_1, hand_2 in ALL_CASES:
+                self.assertEqual(matrix.who_wins(hand_1, hand_2), 
+                                 poker.who_wins(hand_1, hand_2))
+
+            hands = lib_poker.HANDS_BY_STRENGTH
+            for strength_1 in range(0, len(hands), 101):
+                for strength_2 in range(len(hands)):
+                    self.assertEqual(matrix.outcome(strength_1, strength_2), 
+                                     poker.who_wins(hands[strength_1], 
+                                                    hands[strength_2]))
+
+            for strength_1, strength_2 in ((-1, 0), (0, -1), 
+                                           (0, len(hands)), (len(hands), 0)):
+                self.assertEqual(matrix.outcome(strength_1, strength_2), -1)
+
+    def test_bad_file(self):
+        ''' A file that is not an outcome matrix should not be opened. '''
+
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        for data in (b'PKRO' + bytes(100), b'PKRO'):
+            with open(path, 'wb') as the_file:
+                the_file.write(data)
+
+            with self.assertRaises(ValueError):
+                poker_matrix.OutcomeMatrix(path)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
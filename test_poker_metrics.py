@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the instrumentation of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import json
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import poker
+import poker_metrics
+
+
+class TestPokerMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = poker_metrics.enable()
+        self.metrics.reset()
+
+    def tearDown(self):
+        poker_metrics.disable()
+
+    def test_record(self):
+        ''' Every call of who_wins should be counted by combination types, 
+        outcome and path. 
+        '''
+
+        self.assertEqual(poker.who_wins('AAAQQ', 'QQQAA'), 1)
+        self.assertEqual(poker.who_wins('AAAQQ', 'QQAAA'), 0)
+        self.assertEqual(poker.who_wins('23456', 'AAAQQ'), 2)
+        self.assertEqual(poker.who_wins('KKKK', 'AAAQQ'), -1)
+
+        data = self.metrics.to_dict()
+        self.assertEqual([(call['type_1'], call['type_2'], call['outcome'], 
+                           call['count']) for call in data['calls']], 
+                         [(-1, -1, -1, 1), (1, 5, 2, 1), (5, 5, 0, 1), 
+                          (5, 5, 1, 1)])
+        self.assertEqual(data['paths'], 
+                         {'early_exit': 1, 'tie_break': 2, 'invalid': 1})
+        self.assertEqual(sum(data['latency_histograms']['tie_break']), 2)
+        self.assertEqual(json.loads(self.metrics.to_json()), data)
+
+    def test_prometheus(self):
+        ''' The Prometheus export should hold the counters and cumulative 
+        histogram buckets. 
+        '''
+
+        for _ in range(3):
+            poker.who_wins('AAAQQ', 'QQQAA')
+
+        text = self.metrics.to_prometheus()
+        self.assertIn('poker_who_wins_calls_total{type_1="5",type_2="5",'
+                      'outcome="1"} 3\n', text)
+        self.assertIn('poker_who_wins_latency_seconds_bucket{'
+                      'path="tie_break",le="+Inf"} 3\n', text)
+        self.assertIn('poker_who_wins_latency_seconds_count{'
+                      'path="early_exit"} 0\n', text)
+
+    def test_disable(self):
+        ''' A disabled instrumentation should not count anything. '''
+
+        metrics = poker_metrics.disable()
+        poker.who_wins('AAAQQ', 'QQQAA')
+
+        self.assertIs(metrics, self.metrics)
+        self.assertIsNone(poker.metrics)
+        self.assertEqual(metrics.to_dict()['calls'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
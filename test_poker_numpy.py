@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the vectorized version of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import lib_poker
+import poker
+
+try:
+    import numpy as np
+    import poker_numpy
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestPokerNumpy(unittest.TestCase):
+
+    def test_who_wins(self):
+        ''' poker_numpy.who_wins should give the same winners as 
+        poker.who_wins for strings and for card codes. 
+        '''
+
+        hands_1 = [hand_1 for hand_1, hand_2 in ALL_CASES]
+        hands_2 = [hand_2 for hand_1, hand_2 in ALL_CASES]
+        expected = [poker.who_wins(hand_1, hand_2) 
+                    for hand_1, hand_2 in zip(hands_1, hands_2)]
+
+        winners = poker_numpy.who_wins(hands_1, hands_2)
+        self.assertEqual(winners.dtype, np.int8)
+        self.assertEqual(winners.tolist(), expected)
+
+        winners = poker_numpy.who_wins(np.array(hands_1, dtype='S'), 
+                                       np.array(hands_2, dtype='S'))
+        self.assertEqual(winners.tolist(), expected)
+
+    def test_hand_keys(self):
+        ''' hand_keys should order all possible hands like the strength 
+        table and mark impossible hands with -1. 
+        '''
+
+        hands = sorted(lib_poker.STRENGTH_TABLE, 
+                       key=lib_poker.STRENGTH_TABLE.get)
+        keys = poker_numpy.hand_keys(poker_numpy.encode_hands(hands))
+        self.assertTrue((np.diff(keys) > 0).all())
+
+        codes = np.array([[0, 0, 0, 0, 0], [0, 1, 2, 3, 13]], dtype=np.uint8)
+        self.assertEqual(poker_numpy.hand_keys(codes).tolist(), [-1, -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
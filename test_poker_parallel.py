@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the parallel runner of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import tempfile
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import poker
+import poker_parallel
+
+
+class TestPokerParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = ['{} {}'.format(hand_1, hand_2) 
+                      for hand_1, hand_2 in ALL_CASES if hand_1 and hand_2]
+        self.lines += ['XYZAK', '']
+        self.expected = [poker.who_wins(*line.split()) 
+                         if len(line.split()) == 2 else -1 
+                         for line in self.lines]
+
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as the_file:
+            the_file.write('\n'.join(self.lines) + '\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_split_file(self):
+        ''' split_file should cover the file with ranges that start at line 
+        boundaries. 
+        '''
+
+        with open(self.path, 'rb') as the_file:
+            data = the_file.read()
+
+        for shards in (1, 3, 7, 100):
+            ranges = poker_parallel.split_file(self.path, shards)
+            self.assertLessEqual(len(ranges), shards)
+            self.assertEqual(b''.join(data[start:end] for start, end in 
+                                      ranges), data)
+            for start, end in ranges:
+                self.assertTrue(start == 0 or data[start - 1:start] == b'\n')
+
+    def test_evaluate_file(self):
+        ''' evaluate_file should give the winners in input order and 
+        summarize_file should count them, for any number of workers.
+        '''
+
+        for workers in (1, 2):
+            winners = poker_parallel.evaluate_file(self.path, workers)
+            self.assertEqual(winners.tolist(), self.expected)
+
+            summary = poker_parallel.summarize_file(self.path, workers)
+            self.assertEqual(summary, {winner: self.expected.count(winner) 
+                                       for winner in (0, 1, 2, -1)})
+
+            stats = poker_parallel.aggregate_file(self.path, workers)
+            self.assertEqual(stats.outcomes, summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
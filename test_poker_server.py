@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the network service of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import poker_server
+
+
+class TestHandleRequest(unittest.TestCase):
+
+    def test_handle_request(self):
+        ''' handle_request should answer every command and report errors. '''
+
+        cases = (('WINS aaaqq qqqaa', 'OK 1'),
+                 ('wins qqqaa aaaqq', 'OK 2'),
+                 ('WINS aaaqq qqaaa', 'OK 0'),
+                 ('TYPE 22333', 'OK 5'),
+                 ('TYPE 23456', 'OK 1'),
+                 ('SHOWDOWN 99752 aaaqq 22456 qqaaa', 'OK 1 3'),
+                 ('WINS aaaqq', 'ERR WINS needs two hands'),
+                 ('WINS xyzak kqatj', 'ERR The fist hand contain invalid '
+                                      'cards'),
+                 ('TYPE kkkk', 'ERR Not a legal hand'),
+                 ('SHOWDOWN', 'ERR SHOWDOWN needs at least one hand'),
+                 ('PLAY aaaqq', 'ERR Unknown command PLAY'),
+                 ('', 'ERR Empty request'))
+
+        for request, response in cases:
+            self.assertEqual(poker_server.handle_request(request), response)
+
+        requests = [request for request, response in cases] * 2
+        self.assertEqual(poker_server.handle_batch(requests), 
+                         [response for request, response in cases] * 2)
+
+
+class TestLatency(unittest.TestCase):
+
+    def test_lone_request(self):
+        ''' A request that is sent alone should be answered at once, without
+        waiting for a batch to fill. The loop of IsolatedAsyncioTestCase runs
+        in debug mode, which is too slow to measure.
+        '''
+
+        async def measure():
+            server = poker_server.PokerServer()
+            await server.start()
+            reader, writer = await asyncio.open_connection('127.0.0.1', 
+                                                           server.port)
+            clock = asyncio.get_running_loop().time
+            latencies = []
+            for _ in range(500):
+                start = clock()
+                writer.write(b'WINS aaaqq qqqaa\n')
+                self.assertEqual(await reader.readline(), b'OK 1\n')
+                latencies.append(clock() - start)
+            writer.close()
+            await writer.wait_closed()
+            await server.close()
+            return(sorted(latencies))
+
+        latencies = asyncio.run(measure())
+        self.assertLess(latencies[len(latencies) // 2], 0.001)
+
+
+class TestPokerServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = poker_server.PokerServer(max_pipeline=8)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_pipelining(self):
+        ''' Pipelined requests of several connections should get their 
+        responses in order and be evaluated in batches. 
+        '''
+
+        requests = [b'WINS aaaqq qqqaa\n', b'WINS qqqaa aaaqq\n', 
+                    b'TYPE 22333\n', b'WINS aaaqq\n'] * 250
+        responses = [b'OK 1\n', b'OK 2\n', b'OK 5\n', 
+                     b'ERR WINS needs two hands\n'] * 250
+
+        async def client():
+            reader, writer = await asyncio.open_connection(
+                    '127.0.0.1', self.server.port)
+            writer.write(b''.join(requests))
+            await writer.drain()
+            received = [await reader.readline() for _ in requests]
+            writer.close()
+            await writer.wait_closed()
+            return(received)
+
+        results = await asyncio.gather(*[client() for _ in range(4)])
+
+        for received in results:
+            self.assertEqual(received, responses)
+        self.assertEqual(self.server.requests, 4 * len(requests))
+        self.assertLess(self.server.batches, self.server.requests)
+
+    async def test_non_ascii(self):
+        ''' A request with bytes that are not ASCII should get an error and 
+        should not stop the requests after it. 
+        '''
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', 
+                                                       self.server.port)
+        writer.write(b'\xffX aa\nWINS AAAQQ QQQAA\n')
+        await writer.drain()
+        # without a response the connection is stuck, so bound the wait
+        received = [await asyncio.wait_for(reader.readline(), 5) 
+                    for _ in range(2)]
+        writer.close()
+        await writer.wait_closed()
+
+        self.assertEqual(received, [b'ERR Unknown command ?X\n', b'OK 1\n'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the shared evaluation tables of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import multiprocessing
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import lib_poker
+import poker
+import poker_shared
+
+
+class TestPokerShared(unittest.TestCase):
+
+    pairs = ALL_CASES
+
+    def test_get_index(self):
+        ''' Every multiset of 5 cards should get its own index. '''
+
+        indices = {poker_shared.get_index(hand) 
+                   for hand in lib_poker.HANDS_BY_STRENGTH}
+        self.assertEqual(len(indices), len(lib_poker.HANDS_BY_STRENGTH))
+        self.assertEqual(poker_shared.get_index('AAAAA'), 
+                         poker_shared.INDEX_SIZE - 1)
+        self.assertEqual(poker_shared.get_index('Q53Q2'), 
+                         poker_shared.get_index('2Q35Q'))
+        for hand in ('AAAQ', 'AAAQX', 'AAAQQ2'):
+            self.assertEqual(poker_shared.get_index(hand), -1)
+
+    def test_shared_tables(self):
+        ''' Attached tables should give the winners of who_wins, with and 
+        without the outcome matrix. 
+        '''
+
+        for matrix in (False, True):
+            with poker_shared.SharedTables.create(matrix=matrix) as tables:
+                self.assertEqual(tables.has_matrix, matrix)
+                attached = poker_shared.SharedTables.attach(tables.name)
+                self.assertFalse(attached.owner)
+                for hand_1, hand_2 in self.pairs:
+                    self.assertEqual(attached.who_wins(hand_1, hand_2), 
+                                     poker.who_wins(hand_1, hand_2))
+                self.assertEqual(attached.strength('AAAAA'), -1)
+                if matrix:
+                    for strength_1, strength_2 in ((-1, 0), (0, -1), 
+                                                   (0, 6175), (6175, 0)):
+                        self.assertEqual(attached.outcome(strength_1, 
+                                                          strength_2), -1)
+                attached.close()
+            name = tables.name
+
+        with self.assertRaises(FileNotFoundError):
+            poker_shared.SharedTables.attach(name)
+
+    def test_pool(self):
+        ''' The workers of a pool should read the tables of their parent. '''
+
+        pairs = self.pairs
+        with poker_shared.SharedTables.create() as tables:
+            with multiprocessing.Pool(2, initializer=poker_shared.init_worker,
+                                      initargs=(tables.name,)) as pool:
+                winners = pool.map(poker_shared.evaluate_pairs, 
+                                   [pairs[:len(pairs) // 2], 
+                                    pairs[len(pairs) // 2:]])
+
+        self.assertEqual(winners[0] + winners[1], 
+                         [poker.who_wins(hand_1, hand_2) 
+                          for hand_1, hand_2 in pairs])
+
+    def test_worker_without_tables(self):
+        ''' A worker that attaches to the tables should not build or load the
+        tables of lib_poker. 
+        '''
+
+        context = multiprocessing.get_context('spawn')
+        with poker_shared.SharedTables.create() as tables:
+            with context.Pool(1, initializer=poker_shared.init_worker,
+                              initargs=(tables.name,)) as pool:
+                self.assertEqual(pool.apply(poker_shared.evaluate_pairs, 
+                                            (self.pairs[:4],)), 
+                                 [poker.who_wins(hand_1, hand_2) 
+                                  for hand_1, hand_2 in self.pairs[:4]])
+                # a spawned worker only imports what the pool sends to it
+                self.assertFalse(pool.apply(eval, (
+                        "hasattr(__import__('sys').modules.get('lib_poker'), "
+                        "'STRENGTH_TABLE')",)))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the Monte Carlo simulation of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import poker_simulation
+
+
+class TestPokerSimulation(unittest.TestCase):
+
+    def test_simulate(self):
+        ''' A simulation should count every deal and give the same results 
+        for the same seed, whatever the number of workers. 
+        '''
+
+        result = poker_simulation.simulate(2500, seed=7, batch_size=1000)
+        self.assertEqual(result.deals, 2500)
+        self.assertEqual(sum(result.hands_by_type.values()), 5000)
+        self.assertEqual(sum(result.outcomes.values()), 2500)
+
+        self.assertEqual(poker_simulation.simulate(2500, seed=7, workers=2, 
+                                                   batch_size=1000), 
+                         result)
+        self.assertNotEqual(poker_simulation.simulate(2500, seed=8, 
+                                                      batch_size=1000), 
+                            result)
+
+    def test_confidence_interval(self):
+        ''' The interval should contain the observed proportion and narrow 
+        with more trials. 
+        '''
+
+        low, high = poker_simulation.confidence_interval(50, 100)
+        self.assertLess(low, 0.5)
+        self.assertGreater(high, 0.5)
+
+        low_more, high_more = poker_simulation.confidence_interval(5000, 10000)
+        self.assertLess(high_more - low_more, high - low)
+
+        self.assertEqual(poker_simulation.confidence_interval(0, 0), (0.0, 1.0))
+        self.assertEqual(poker_simulation.confidence_interval(0, 10)[0], 0.0)
+
+    def test_report(self):
+        ''' The report should give a rate and an interval for every 
+        combination type and outcome. 
+        '''
+
+        summary = poker_simulation.report(poker_simulation.simulate(100))
+
+        self.assertEqual(summary['deals'], 100)
+        self.assertEqual(len(summary['combination_types']), 6)
+        self.assertEqual(len(summary['outcomes']), 3)
+        for rate, low, high in summary['outcomes'].values():
+            self.assertTrue(low <= rate <= high)
+
+
+if __name__ == '__main__':
+    unittest.main()
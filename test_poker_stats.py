@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the matchup statistics of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import json
+import random
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+from test_poker import ALL_CASES
+import lib_poker
+import poker
+import poker_stats
+
+
+class TestPokerStats(unittest.TestCase):
+
+    def test_update(self):
+        ''' The statistics should count the winners of who_wins, by 
+        combination types and by hand. 
+        '''
+
+        pairs = ALL_CASES
+        stats = poker_stats.MatchupStats().update(iter(pairs))
+
+        winners = [poker.who_wins(hand_1, hand_2) for hand_1, hand_2 in pairs]
+        self.assertEqual(stats.outcomes, {winner: winners.count(winner) 
+                                          for winner in (0, 1, 2, -1)})
+        self.assertEqual(stats.total, len(pairs))
+        self.assertEqual(stats.tie_rate, 
+                         winners.count(0) / (len(pairs) - winners.count(-1)))
+        self.assertEqual(sum(sum(cell[0] for cell in row) 
+                             for row in stats.type_matrix), 
+                         winners.count(0))
+        # four of a kind against full house
+        self.assertEqual(stats.type_matrix[5][4], [0, 1, 0])
+
+        strength = lib_poker.get_hand_strength('AAAQQ')
+        self.assertEqual(stats.hand_counts[strength], 8)
+        self.assertEqual(stats.hand_wins[strength], 2)
+        self.assertEqual(json.loads(stats.to_json())['hands']['AAAQQ'], 
+                         {'count': 8, 'wins': 2})
+
+    def test_merge(self):
+        ''' The merged statistics of two shards should be those of all the 
+        pairs. 
+        '''
+
+        rng = random.Random(5)
+        hands = lib_poker.HANDS_BY_STRENGTH + ['AAAAA']
+        pairs = [(rng.choice(hands), rng.choice(hands)) for pair in range(500)]
+
+        merged = poker_stats.MatchupStats().update(pairs[:200])
+        merged += poker_stats.MatchupStats().update(pairs[200:])
+        self.assertEqual(merged.to_dict(), 
+                         poker_stats.MatchupStats().update(pairs).to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the suited evaluator of the poker game, which ranks real 
+poker hands with suits, including flushes, straights and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import collections
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import poker_suited
+
+
+class TestPokerSuited(unittest.TestCase):
+
+    def test_tables(self):
+        ''' The tables should rank the 7462 distinct hands of real poker. '''
+
+        classes = collections.Counter(poker_suited.CATEGORY_BY_STRENGTH)
+        self.assertEqual([classes[category] for category in range(1, 10)], 
+                         [1277, 2860, 858, 858, 10, 1277, 156, 156, 10])
+        self.assertEqual(poker_suited.CATEGORY_BY_STRENGTH, 
+                         sorted(poker_suited.CATEGORY_BY_STRENGTH))
+
+    def test_who_wins(self):
+        ''' Each hand should beat the next one and hands should not share 
+        cards. 
+        '''
+
+        hands = ['AsKsQsJsTs', '5h4h3h2hAh', 'AsAdAhAcKs', 'AsAdAhKcKs', 
+                 'KsKdKhAcAd', 'Ad9d7d4d3d', '2s3s4s5s7s', 'AcKdQhJsTs', 
+                 '6s5d4c3h2h', 'Ac5d4c3h2h', '7s7d7hAcKd', 'AsAd3h3c2d', 
+                 'KsKd3h3c2d', 'AsAd9h8c7d', 'AsKd9h8c7d', '8s7d5h4c3d']
+        for hand_1, hand_2 in zip(hands, hands[1:]):
+            self.assertGreater(poker_suited.get_hand_strength(hand_1), 
+                               poker_suited.get_hand_strength(hand_2))
+
+        self.assertEqual(poker_suited.who_wins('2s3s4s5s7s', 'AcKdQhJsTh'), 1)
+        self.assertEqual(poker_suited.who_wins('AcKdQhJsTh', '2s3s4s5s7s'), 2)
+        self.assertEqual(poker_suited.who_wins('Ac5d4c3h2h', '5s4s3d2dAh'), 0)
+        self.assertEqual(poker_suited.get_category('Ac5d4c3h2h'), 'straight')
+        self.assertEqual(poker_suited.get_category('5h4h3h2hAh'), 
+                         'straight flush')
+
+        codes = [poker_suited.parse_hand(hand) for hand in hands]
+        self.assertEqual(poker_suited.evaluate_hands(codes), 
+                         [poker_suited.evaluate(*hand) for hand in codes])
+
+        for hand_1, hand_2 in (('AsKsQsJsTs', 'AsKdQhJcTd'), 
+                               ('AsKsQsJsTs', 'AsKsQsJsTx'),
+                               ('AsAsQsJsTs', 'AdKdQhJcTd'),
+                               ('AsKsQsJs', 'AdKdQhJcTd')):
+            self.assertEqual(poker_suited.who_wins(hand_1, hand_2), -1)
+        self.assertEqual(poker_suited.get_hand_strength('AsKsQsJs2'), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
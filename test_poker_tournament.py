@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""A test code for the tournament simulator of the poker game.
+The program assumes that the cards don't have suits and there are 
+no flushes, straights, and straight flushes.
+"""
+
+# Copyright (c) 2019 Alemnew Sheferaw Asrese
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import poker_testing
+poker_testing.use_cache_directory()
+
+import poker
+import poker_tournament
+
+
+class TestPokerTournament(unittest.TestCase):
+
+    def test_seat_players(self):
+        ''' The players should be seated at balanced tables. '''
+
+        tables = poker_tournament.seat_players(0, 0, 0, range(20), 9)
+        self.assertEqual([len(players) for players in tables], [7, 7, 6])
+        self.assertEqual(sorted(sum(tables, [])), list(range(20)))
+        self.assertEqual(tables, 
+                         poker_tournament.seat_players(0, 0, 0, range(20), 9))
+
+    def test_play_table(self):
+        ''' A table should be won by the showdown of the hands dealt from 
+        its random generator. 
+        '''
+
+        players = [3, 1, 4, 5, 9]
+        rng = poker_tournament.get_table_random(7, 0, 2, 1)
+        cards = ''.join(rng.sample(poker_tournament.DECK, 25))
+        hands = [cards[start:start + 5] for start in range(0, 25, 5)]
+
+        self.assertEqual(poker_tournament.play_table(7, 0, 2, 1, players), 
+                         [players[index] for index in poker.showdown(hands)])
+
+    def test_simulate_tournaments(self):
+        ''' The tournaments should end with one winner each and should not 
+        depend on the number of workers. 
+        '''
+
+        result = poker_tournament.simulate_tournaments(40, tournaments=3, 
+                                                       seed=11)
+        self.assertEqual(len(result.winners), 3)
+        self.assertTrue(all(0 <= winner < 40 for winner in result.winners))
+        # 5 tables, then at least 1 more table per tournament
+        self.assertGreaterEqual(result.tables, 3 * 6)
+        self.assertEqual(result[:4], poker_tournament.simulate_tournaments(
+            40, tournaments=3, seed=11, workers=2)[:4])
+
+        summary = poker_tournament.report(result)
+        self.assertEqual(summary['tables'], result.tables)
+        self.assertGreater(summary['tables_per_second'], 0)
+
+        self.assertEqual(poker_tournament.simulate_tournaments(1).winners, [0])
+        for seats in (1, poker_tournament.MAX_SEATS + 1):
+            with self.assertRaises(ValueError):
+                poker_tournament.simulate_tournaments(10, seats=seats)
+
+
+if __name__ == '__main__':
+    unittest.main()